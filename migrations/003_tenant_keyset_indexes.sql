@@ -0,0 +1,22 @@
+-- MetaGate v0.3 Tenant Keyset Indexes
+-- Backs the tenant-scoped admin queries: keyset-paginated lists filter on
+-- tenant_key and order by id, and get/delete filter on id plus tenant_key.
+--
+-- CONCURRENTLY avoids blocking writes on live tables; run this file outside
+-- an explicit transaction (e.g. psql -f without --single-transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_principals_tenant_id ON principals(tenant_key, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profiles_tenant_id ON profiles(tenant_key, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manifests_tenant_id ON manifests(tenant_key, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bindings_tenant_id ON bindings(tenant_key, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_secret_refs_tenant_id ON secret_refs(tenant_key, id);
+
+-- Binding deactivation filters on (principal_id, tenant_key) among active rows;
+-- the existing unique partial index on principal_id already bounds it to one row.
+
+-- The composite indexes lead with tenant_key, making the single-column ones redundant
+DROP INDEX CONCURRENTLY IF EXISTS idx_principals_tenant;
+DROP INDEX CONCURRENTLY IF EXISTS idx_profiles_tenant;
+DROP INDEX CONCURRENTLY IF EXISTS idx_manifests_tenant;
+DROP INDEX CONCURRENTLY IF EXISTS idx_bindings_tenant;
+DROP INDEX CONCURRENTLY IF EXISTS idx_secret_refs_tenant;
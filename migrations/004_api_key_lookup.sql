@@ -0,0 +1,11 @@
+-- MetaGate v0.4 API Key Lookup
+-- Adds a deterministic HMAC-SHA256 lookup value so API key verification is a
+-- single indexed query followed by one bcrypt check, instead of a bcrypt scan
+-- over every active key. Existing rows keep key_lookup NULL and are backfilled
+-- the first time their key is used.
+--
+-- Run outside an explicit transaction (CREATE INDEX CONCURRENTLY).
+
+ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS key_lookup TEXT;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_api_keys_key_lookup ON api_keys(key_lookup);
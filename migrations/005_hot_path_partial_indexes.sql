@@ -0,0 +1,17 @@
+-- MetaGate v0.5 Hot Path Partial Indexes
+-- Most hot predicates are already served by existing indexes:
+--   principals(auth_subject)          UNIQUE, JWT principal lookup
+--   api_keys(key_lookup)              UNIQUE, API key lookup (004)
+--   bindings(principal_id) WHERE active  UNIQUE partial, active binding lookup (001)
+--   <table>(tenant_key, id)           admin list/get/delete (003)
+-- This migration covers the remaining filtered scans.
+--
+-- Run outside an explicit transaction (CREATE INDEX CONCURRENTLY).
+
+-- Bootstrap loads a tenant's active secret refs on every packet build
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_secret_refs_tenant_active
+    ON secret_refs(tenant_key) WHERE status = 'active';
+
+-- Legacy API keys without a lookup value are scanned until backfilled
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_api_keys_legacy_active
+    ON api_keys(id) WHERE key_lookup IS NULL AND status = 'active';
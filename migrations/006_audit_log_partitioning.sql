@@ -0,0 +1,78 @@
+-- MetaGate v0.6 Audit Log Partitioning
+-- Converts audit_log into a table range-partitioned by month on timestamp.
+-- Inserts only touch the current month's partition and indexes, time-bounded
+-- queries are pruned to the months they cover, and retiring a month is
+-- DROP TABLE audit_log_YYYY_MM instead of a row-by-row DELETE.
+--
+-- PostgreSQL requires the partition key in every unique constraint, so the
+-- primary key becomes (id, timestamp).
+--
+-- Run inside a single transaction (psql --single-transaction); audit writes
+-- are blocked while existing rows are copied.
+
+-- Creates the partition holding the month that contains month_start.
+-- MetaGate calls this for the next month from its hourly maintenance task.
+CREATE OR REPLACE FUNCTION ensure_audit_log_partition(month_start DATE)
+RETURNS VOID AS $$
+DECLARE
+    lower_bound DATE := date_trunc('month', month_start)::DATE;
+    upper_bound DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_log FOR VALUES FROM (%L) TO (%L)',
+        'audit_log_' || to_char(lower_bound, 'YYYY_MM'),
+        lower_bound,
+        upper_bound
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE audit_log RENAME TO audit_log_unpartitioned;
+ALTER TABLE audit_log_unpartitioned RENAME CONSTRAINT audit_log_pkey TO audit_log_unpartitioned_pkey;
+
+CREATE TABLE audit_log (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    tenant_key TEXT NOT NULL DEFAULT 'default',
+    timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+    action TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    resource_id UUID NOT NULL,
+    resource_key TEXT,
+    actor_principal_key TEXT NOT NULL,
+    actor_ip TEXT,
+    actor_user_agent TEXT,
+    changes JSONB,
+    metadata JSONB,
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Partitions for every month with existing rows, plus the current and next month
+DO $$
+DECLARE
+    first_month DATE;
+    month DATE;
+BEGIN
+    SELECT COALESCE(min(date_trunc('month', timestamp))::DATE, date_trunc('month', now())::DATE)
+        INTO first_month
+        FROM audit_log_unpartitioned;
+    month := LEAST(first_month, date_trunc('month', now())::DATE);
+    WHILE month <= (date_trunc('month', now()) + INTERVAL '1 month')::DATE LOOP
+        PERFORM ensure_audit_log_partition(month);
+        month := (month + INTERVAL '1 month')::DATE;
+    END LOOP;
+END;
+$$;
+
+INSERT INTO audit_log SELECT * FROM audit_log_unpartitioned;
+
+DROP TABLE audit_log_unpartitioned;
+
+-- Indexes on the parent are created on every partition, current and future.
+-- The single-column tenant, timestamp, action and resource_type indexes are not
+-- recreated: the composite index leads with tenant_key, partition pruning covers
+-- time ranges, and action/resource_type are too unselective to help.
+CREATE INDEX IF NOT EXISTS idx_audit_log_tenant_time_type ON audit_log(tenant_key, timestamp, resource_type);
+CREATE INDEX IF NOT EXISTS idx_audit_log_resource_id ON audit_log(resource_id);
+CREATE INDEX IF NOT EXISTS idx_audit_log_actor ON audit_log(actor_principal_key);
+
+COMMENT ON TABLE audit_log IS 'Immutable audit trail for security-sensitive operations on principals, profiles, manifests, and bindings';
@@ -0,0 +1,15 @@
+-- MetaGate v0.7 Audit Log JSONB Indexes
+-- Audit searches filter on changes and metadata by containment, e.g.
+--   changes @> '{"status": "revoked"}'
+-- jsonb_path_ops GIN indexes serve @> at roughly half the size of the default
+-- jsonb_ops class. Queries must use @> rather than ->> equality to use them.
+--
+-- audit_log is partitioned (006). CONCURRENTLY is not supported on a partitioned
+-- parent; an index on the parent is built on every existing partition and
+-- created automatically on new ones. Run during a quiet period.
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_changes_gin
+    ON audit_log USING gin (changes jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_metadata_gin
+    ON audit_log USING gin (metadata jsonb_path_ops);
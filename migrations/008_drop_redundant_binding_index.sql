@@ -0,0 +1,9 @@
+-- MetaGate v0.8 Drop Redundant Binding Index
+-- The active-binding lookup (principal_id = ? AND active) is answered by the
+-- unique partial index idx_bindings_principal_active from 001, which holds
+-- only active rows and guarantees at most one match. The single-column index
+-- on the boolean active flag serves no query and only adds write cost.
+--
+-- Run outside an explicit transaction (DROP INDEX CONCURRENTLY).
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_bindings_active;
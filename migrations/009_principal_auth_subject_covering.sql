@@ -0,0 +1,15 @@
+-- MetaGate v0.9 Principal Auth Subject Covering Index
+-- JWT authentication looks up the active principal by auth_subject and reads
+-- only id, tenant_key, principal_key, principal_type and status. A unique
+-- index on auth_subject that INCLUDEs those columns lets the lookup run as an
+-- index-only scan instead of visiting the heap for every request.
+--
+-- It replaces the UNIQUE constraint from 001 and the duplicate plain index.
+-- Run outside an explicit transaction (CREATE INDEX CONCURRENTLY).
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_principals_auth_subject_cov
+    ON principals(auth_subject)
+    INCLUDE (id, tenant_key, principal_key, principal_type, status);
+
+ALTER TABLE principals DROP CONSTRAINT IF EXISTS principals_auth_subject_key;
+DROP INDEX CONCURRENTLY IF EXISTS idx_principals_auth_subject;
@@ -0,0 +1,12 @@
+-- MetaGate v0.10 Startup Session Digest Bytes
+-- packet_etag (16-byte digest) and packet_hash_redacted (8-byte digest prefix)
+-- were stored as hex TEXT. Storing the raw bytes halves their size in every
+-- startup_sessions row, in WAL and on the wire. The application still exposes
+-- both as hex strings.
+--
+-- Rewrites startup_sessions under an ACCESS EXCLUSIVE lock; run during a quiet
+-- period.
+
+ALTER TABLE startup_sessions
+    ALTER COLUMN packet_etag TYPE BYTEA USING decode(packet_etag, 'hex'),
+    ALTER COLUMN packet_hash_redacted TYPE BYTEA USING decode(packet_hash_redacted, 'hex');
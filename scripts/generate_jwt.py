@@ -6,7 +6,7 @@ Usage: python scripts/generate_jwt.py [auth_subject] [--secret SECRET]
 """
 import argparse
 from datetime import datetime, timezone, timedelta
-from jose import jwt
+import jwt
 
 
 def generate_jwt(
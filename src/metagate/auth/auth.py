@@ -1,19 +1,28 @@
 """Authentication module supporting JWT and API Key."""
 from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
-from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from datetime import datetime, timezone
-from typing import Optional
+from sqlalchemy.orm import joinedload
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Any, Callable, Optional
+import asyncio
 import hashlib
+import hmac
+import os
 import secrets
+import time
 
+import jwt
+import orjson
 from passlib.hash import bcrypt
 
 from ..config import get_settings
 from ..database import get_db
 from ..models.db_models import Principal, ApiKey
+from .verification_cache import MISSING, TTLCache
 
 settings = get_settings()
 
@@ -21,136 +30,367 @@ settings = get_settings()
 bearer_scheme = HTTPBearer(auto_error=False)
 api_key_header = APIKeyHeader(name=settings.api_key_header, auto_error=False)
 
+# Settings are fixed for the process lifetime; bind the hot-path values once.
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
+_JWT_ISSUER = settings.jwt_issuer or None
+_JWT_CACHE_TTL = float(settings.jwt_cache_ttl_seconds)
+_ADMIN_PRINCIPAL_TYPES = frozenset(settings.admin_principal_types)
+_ADMIN_PRINCIPAL_KEYS = frozenset(settings.admin_principal_keys)
+
+# API keys are random, high-entropy secrets, so a lower bcrypt cost keeps verification
+# latency down without weakening them against guessing. Existing hashes keep their cost.
+_API_KEY_HASHER = bcrypt.using(rounds=settings.api_key_bcrypt_rounds)
+
+# bcrypt is CPU-bound; run it off the event loop on a pool sized to the available cores.
+_BCRYPT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, os.cpu_count() or 1),
+    thread_name_prefix="metagate-bcrypt",
+)
+
+# Parse the verification key once; PEM parsing for RS*/ES* keys is costly per request.
+_JWT_KEY = jwt.get_algorithm_by_name(settings.jwt_algorithm).prepare_key(settings.jwt_secret)
+
+# Columns included in idx_principals_auth_subject_cov (migration 009); selecting only
+# these lets PostgreSQL answer the JWT principal lookup with an index-only scan. They
+# are also the principal fields kept in an AuthenticatedPrincipal snapshot.
+_JWT_PRINCIPAL_COLUMNS = (
+    Principal.id,
+    Principal.tenant_key,
+    Principal.principal_key,
+    Principal.auth_subject,
+    Principal.principal_type,
+    Principal.status,
+)
+
+_LAST_USED_INTERVAL = timedelta(seconds=settings.api_key_last_used_interval_seconds)
+
+# Dedicated secret for API key lookups; it must stay independent of the JWT secret so
+# rotating one never orphans the other. Empty is only accepted in debug.
+_API_KEY_PEPPER = settings.api_key_pepper.encode()
+_LEGACY_SCAN = settings.api_key_legacy_scan
+
+# blake2b(token) -> (verified subject, exp), held no longer than the token's remaining lifetime.
+# Hits skip signature and claim verification; the principal is still loaded per request.
+jwt_cache = TTLCache(
+    maxsize=settings.jwt_cache_size if settings.jwt_cache_ttl_seconds > 0 else 0,
+    ttl=settings.jwt_cache_ttl_seconds,
+)
+
+# compute_key_lookup(api_key) -> matching ApiKey id. Misses are not cached.
+# Hits skip the bcrypt scan; the record is still re-read so revocation applies at once.
+api_key_cache = TTLCache(
+    maxsize=settings.api_key_cache_size if settings.api_key_cache_ttl_seconds > 0 else 0,
+    ttl=settings.api_key_cache_ttl_seconds,
+)
+
+# sha256(token) -> AuthenticatedPrincipal.snapshot() for MCP calls. Failures are not
+# cached. The short TTL bounds how long a revoked key or deactivated principal keeps working.
+auth_cache = TTLCache(
+    maxsize=settings.auth_cache_size if settings.auth_cache_ttl_seconds > 0 else 0,
+    ttl=settings.auth_cache_ttl_seconds,
+)
+
+
+class PrebuiltHTTPException(HTTPException):
+    """HTTPException for a static error whose JSON body is serialized once per subclass.
+
+    Subclasses set ``status_code``, ``detail`` and optionally ``headers`` as class
+    attributes and are raised without arguments.
+    """
+
+    status_code: int
+    detail: str
+    headers: Optional[dict[str, str]] = None
+    body: bytes
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.body = orjson.dumps({"detail": cls.detail})
+
+    def __init__(self):
+        super().__init__(status_code=self.status_code, detail=self.detail, headers=self.headers)
+
+
+class UnauthenticatedError(PrebuiltHTTPException):
+    status_code = status.HTTP_401_UNAUTHORIZED
+    detail = "Invalid or missing authentication credentials"
+    headers = {"WWW-Authenticate": "Bearer"}
+
+
+class PrincipalInactiveError(PrebuiltHTTPException):
+    status_code = status.HTTP_403_FORBIDDEN
+    detail = "Principal not found or inactive"
+
+
+class AdminRequiredError(PrebuiltHTTPException):
+    status_code = status.HTTP_403_FORBIDDEN
+    detail = "Admin privileges required"
+
+
+# (auth_subject, auth_method, expires_at, principal column values or None)
+AuthSnapshot = tuple[str, str, Optional[float], Optional[tuple[Any, ...]]]
+
 
 class AuthenticatedPrincipal:
-    """Represents an authenticated principal."""
+    """Represents an authenticated principal.
+
+    ``expires_at`` is the Unix time at which the presented credential stops being
+    valid, when the credential carries one (JWT ``exp``).
+    """
 
     def __init__(
         self,
         auth_subject: str,
         principal: Optional[Principal] = None,
-        auth_method: str = "unknown"
+        auth_method: str = "unknown",
+        expires_at: Optional[float] = None,
     ):
         self.auth_subject = auth_subject
         self.principal = principal
         self.auth_method = auth_method
+        self.expires_at = expires_at
+        self.tenant_key: Optional[str] = principal.tenant_key if principal else None
 
     @property
     def principal_key(self) -> Optional[str]:
         return self.principal.principal_key if self.principal else None
 
+    @cached_property
+    def is_admin(self) -> bool:
+        """Whether the principal may use admin tools, computed once per instance."""
+        return self.principal is not None and is_admin_principal(self.principal)
+
+    def snapshot(self) -> AuthSnapshot:
+        """Return the immutable fields needed to rebuild this principal without a session."""
+        principal = None
+        if self.principal is not None:
+            principal = tuple(getattr(self.principal, column.key) for column in _JWT_PRINCIPAL_COLUMNS)
+        return self.auth_subject, self.auth_method, self.expires_at, principal
+
+    @classmethod
+    def from_snapshot(cls, snapshot: AuthSnapshot) -> "AuthenticatedPrincipal":
+        """Rebuild an authenticated principal around a transient ``Principal``."""
+        auth_subject, auth_method, expires_at, fields = snapshot
+        principal = None
+        if fields is not None:
+            principal = Principal(**{column.key: value for column, value in zip(_JWT_PRINCIPAL_COLUMNS, fields)})
+        return cls(auth_subject, principal, auth_method=auth_method, expires_at=expires_at)
+
 
 def is_admin_principal(principal: Principal) -> bool:
     """Return True if principal is allowed to access admin endpoints."""
-    if principal.principal_type in settings.admin_principal_types:
-        return True
-    if principal.principal_key in settings.admin_principal_keys:
-        return True
-    return False
+    return (
+        principal.principal_type in _ADMIN_PRINCIPAL_TYPES
+        or principal.principal_key in _ADMIN_PRINCIPAL_KEYS
+    )
 
 
 def hash_api_key(api_key: str) -> str:
     """Hash an API key for storage/lookup."""
     try:
-        return bcrypt.hash(api_key)
+        return _API_KEY_HASHER.hash(api_key)
     except Exception:
         if settings.debug:
             return hashlib.sha256(api_key.encode()).hexdigest()
         raise
 
 
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 def _is_bcrypt_hash(value: str) -> bool:
     return value.startswith("$2")
 
 
-async def verify_jwt(token: str, db: AsyncSession) -> Optional[AuthenticatedPrincipal]:
-    """Verify a JWT token and return the authenticated principal."""
+def looks_like_jwt(token: str) -> bool:
+    """Cheap shape check: three dot-separated segments with a base64url JSON header.
+
+    API keys never match, so they skip JWT decoding and signature checks entirely.
+    """
+    return token.startswith("ey") and token.count(".") == 2
+
+
+def _decode_jwt(token: str) -> Optional[tuple[str, Optional[float], float]]:
+    """Verify a JWT's signature and claims, returning its subject, expiry and cache lifetime."""
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            issuer=_JWT_ISSUER,
             options={"verify_aud": False}  # Audience verification optional
         )
+    except jwt.PyJWTError:
+        return None
+
+    auth_subject = payload.get("sub")
+    if not auth_subject:
+        return None
+
+    # Never cache a token past its own expiry.
+    ttl = _JWT_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        exp = float(exp)
+        ttl = min(ttl, exp - time.time())
+    return auth_subject, exp, ttl
 
-        # Check issuer if configured
-        if settings.jwt_issuer and payload.get("iss") != settings.jwt_issuer:
-            return None
 
-        # Extract subject
-        auth_subject = payload.get("sub")
-        if not auth_subject:
+async def verify_jwt(token: str, db: AsyncSession) -> Optional[AuthenticatedPrincipal]:
+    """Verify a JWT token and return the authenticated principal."""
+    token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = jwt_cache.get(token_hash)
+    if cached is MISSING:
+        decoded = _decode_jwt(token)
+        if decoded is None:
             return None
+        auth_subject, expires_at, ttl = decoded
+        if ttl > 0:
+            jwt_cache.set(token_hash, (auth_subject, expires_at), ttl=ttl)
+    else:
+        auth_subject, expires_at = cached
 
-        # Look up principal by auth_subject
-        result = await db.execute(
-            select(Principal).where(
-                Principal.auth_subject == auth_subject,
-                Principal.status == "active"
-            )
+    # Look up principal by auth_subject, reading only columns the covering index holds
+    result = await db.execute(
+        select(*_JWT_PRINCIPAL_COLUMNS).where(
+            Principal.auth_subject == auth_subject,
+            Principal.status == "active"
         )
-        principal = result.scalar_one_or_none()
+    )
+    row = result.mappings().one_or_none()
+    # Built outside the session so a later db.get() of this id loads the full row
+    # instead of returning a partly loaded instance from the identity map.
+    principal = Principal(**row) if row else None
 
-        return AuthenticatedPrincipal(
-            auth_subject=auth_subject,
-            principal=principal,
-            auth_method="jwt"
-        )
+    return AuthenticatedPrincipal(
+        auth_subject=auth_subject,
+        principal=principal,
+        auth_method="jwt",
+        expires_at=expires_at,
+    )
 
-    except JWTError:
-        return None
 
+def compute_key_lookup(api_key: str) -> str:
+    """Derive the deterministic, indexed lookup value for an API key."""
+    return hmac.new(_API_KEY_PEPPER, api_key.encode(), hashlib.sha256).hexdigest()
 
-async def verify_api_key(api_key: str, db: AsyncSession) -> Optional[AuthenticatedPrincipal]:
-    """Verify an API key and return the authenticated principal."""
+
+async def _run_bcrypt(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a bcrypt operation on the dedicated thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_BCRYPT_EXECUTOR, func, *args)
+
+
+async def _matches_key_hash(api_key: str, key_hash: str, legacy_hash: str) -> bool:
+    """Check an API key against its stored bcrypt (or legacy sha256) verifier."""
+    if _is_bcrypt_hash(key_hash):
+        return await _run_bcrypt(bcrypt.verify, api_key, key_hash)
+    return secrets.compare_digest(key_hash, legacy_hash)
+
+
+_WITH_PRINCIPAL = joinedload(ApiKey.principal)
+
+# Once a legacy scan finds no rows without a lookup value, misses skip the scan until
+# this monotonic deadline; the periodic recheck picks up keys inserted without one.
+_LEGACY_SCAN_RECHECK_SECONDS = 300.0
+_legacy_scan_idle_until = 0.0
+
+
+def _reset_legacy_scan() -> None:
+    """Forget that no legacy keys remain, so the next miss scans again."""
+    global _legacy_scan_idle_until
+    _legacy_scan_idle_until = 0.0
+
+
+async def _find_api_key_record(
+    api_key: str,
+    key_lookup: str,
+    legacy_hash: str,
+    db: AsyncSession,
+    now: datetime,
+) -> Optional[ApiKey]:
+    """Find the active API key record matching api_key.
+
+    Keys with a lookup value are found by one indexed query and verified once.
+    Rows created before lookup values existed are scanned and backfilled on match,
+    unless the scan is disabled or a recent scan found no such rows.
+    """
+    global _legacy_scan_idle_until
+    result = await db.execute(
+        select(ApiKey)
+        .options(_WITH_PRINCIPAL)
+        .where(ApiKey.key_lookup == key_lookup, ApiKey.status == "active")
+    )
+    record = result.scalar_one_or_none()
+    if record is not None:
+        return record if await _matches_key_hash(api_key, record.key_hash, legacy_hash) else None
+
+    if not _LEGACY_SCAN or time.monotonic() < _legacy_scan_idle_until:
+        return None
     result = await db.execute(
-        select(ApiKey).where(ApiKey.status == "active")
+        select(ApiKey)
+        .options(_WITH_PRINCIPAL)
+        .where(ApiKey.key_lookup.is_(None), ApiKey.status == "active")
     )
-    api_key_records = result.scalars().all()
+    legacy_records = result.scalars().all()
+    if not legacy_records:
+        _legacy_scan_idle_until = time.monotonic() + _LEGACY_SCAN_RECHECK_SECONDS
+    for record in legacy_records:
+        expires_at = _as_utc(record.expires_at)
+        if expires_at is not None and expires_at < now:
+            continue
+        if await _matches_key_hash(api_key, record.key_hash, legacy_hash):
+            record.key_lookup = key_lookup
+            return record
+    return None
 
+
+async def verify_api_key(api_key: str, db: AsyncSession) -> Optional[AuthenticatedPrincipal]:
+    """Verify an API key and return the authenticated principal."""
     now = datetime.now(timezone.utc)
+    key_lookup = compute_key_lookup(api_key)
     legacy_hash = hashlib.sha256(api_key.encode()).hexdigest()
     api_key_record = None
-    upgrade_legacy = False
 
-    for record in api_key_records:
-        if record.expires_at and record.expires_at < now:
-            continue
-        if _is_bcrypt_hash(record.key_hash):
-            if bcrypt.verify(api_key, record.key_hash):
-                api_key_record = record
-                break
-        else:
-            if secrets.compare_digest(record.key_hash, legacy_hash):
-                api_key_record = record
-                upgrade_legacy = True
-                break
+    cached_id = api_key_cache.get(key_lookup)
+    if cached_id is not MISSING:
+        api_key_record = await db.get(ApiKey, cached_id, options=[_WITH_PRINCIPAL])
+        if api_key_record is None or api_key_record.status != "active":
+            api_key_cache.pop(key_lookup)
+            api_key_record = None
+
+    if api_key_record is None:
+        api_key_record = await _find_api_key_record(api_key, key_lookup, legacy_hash, db, now)
+        # Only hits are cached: a negative entry would keep rejecting a key created or
+        # re-activated just after a failed attempt, and bogus keys would evict real ones.
+        if api_key_record is not None:
+            api_key_cache.set(key_lookup, api_key_record.id)
 
     if not api_key_record:
         return None
 
     # Check expiration
-    if api_key_record.expires_at and api_key_record.expires_at < now:
+    expires_at = _as_utc(api_key_record.expires_at)
+    if expires_at is not None and expires_at < now:
         return None
 
-    if upgrade_legacy:
-        api_key_record.key_hash = hash_api_key(api_key)
+    # Principal is loaded alongside the key
+    principal = api_key_record.principal
+    if not principal or principal.status != "active":
+        return None
 
-    # Update last used timestamp (best effort, non-blocking)
-    api_key_record.last_used_at = now
-    await db.commit()
+    if not _is_bcrypt_hash(api_key_record.key_hash):
+        api_key_record.key_hash = await _run_bcrypt(hash_api_key, api_key)
 
-    # Get principal
-    result = await db.execute(
-        select(Principal).where(
-            Principal.id == api_key_record.principal_id,
-            Principal.status == "active"
-        )
-    )
-    principal = result.scalar_one_or_none()
-
-    if not principal:
-        return None
+    # Only refresh last_used_at once per interval so hot keys do not turn every
+    # request into a row write; the commit also ends the read transaction.
+    last_used_at = _as_utc(api_key_record.last_used_at)
+    if last_used_at is None or now - last_used_at >= _LAST_USED_INTERVAL:
+        api_key_record.last_used_at = now
+    await db.commit()
 
     return AuthenticatedPrincipal(
         auth_subject=principal.auth_subject,
@@ -159,37 +399,44 @@ async def verify_api_key(api_key: str, db: AsyncSession) -> Optional[Authenticat
     )
 
 
-async def get_authenticated_principal(
+async def _extract_credentials(
     bearer: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme),
     api_key: Optional[str] = Security(api_key_header),
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Dependency that pulls the JWT and API key from the request.
+    Raises 401 when neither is present, before any database session is opened.
+    """
+    token = bearer.credentials if bearer and bearer.credentials else None
+    if not token and not api_key:
+        raise UnauthenticatedError()
+    return token, api_key
+
+
+async def get_authenticated_principal(
+    credentials: tuple[Optional[str], Optional[str]] = Depends(_extract_credentials),
     db: AsyncSession = Depends(get_db),
 ) -> AuthenticatedPrincipal:
     """
     Dependency that authenticates the caller via JWT or API key.
     Returns the authenticated principal or raises 401/403.
     """
+    token, api_key = credentials
     authenticated = None
 
     # Try JWT first
-    if bearer and bearer.credentials:
-        authenticated = await verify_jwt(bearer.credentials, db)
+    if token and looks_like_jwt(token):
+        authenticated = await verify_jwt(token, db)
 
     # Fall back to API key
     if not authenticated and api_key:
         authenticated = await verify_api_key(api_key, db)
 
     if not authenticated:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthenticatedError()
 
     if not authenticated.principal:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Principal not found or inactive",
-        )
+        raise PrincipalInactiveError()
 
     return authenticated
 
@@ -198,9 +445,6 @@ async def require_admin(
     auth: AuthenticatedPrincipal = Depends(get_authenticated_principal),
 ) -> AuthenticatedPrincipal:
     """Require admin privileges for sensitive endpoints."""
-    if not auth.principal or not is_admin_principal(auth.principal):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required",
-        )
+    if not auth.is_admin:
+        raise AdminRequiredError()
     return auth
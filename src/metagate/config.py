@@ -1,8 +1,7 @@
 """Configuration management for MetaGate."""
-import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, field_validator, ValidationInfo
-from typing import Optional
+from pydantic import Field, model_validator
+from typing import Final, Optional
 from functools import lru_cache
 
 
@@ -15,6 +14,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Database
@@ -23,6 +23,17 @@ class Settings(BaseSettings):
         description="Database connection URL"
     )
 
+    db_pool_size: int = Field(default=20, description="Persistent connections per worker pool")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed above the pool size")
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a pooled connection")
+    db_pool_recycle: int = Field(default=1800, description="Seconds before a pooled connection is replaced")
+    db_pool_pre_ping: bool = Field(default=False, description="Test connections before handing them out")
+    db_pool_use_lifo: bool = Field(default=True, description="Reuse the most recently returned connection first")
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="Behind PgBouncer transaction pooling: no local pool and no prepared statement caches"
+    )
+
     # Server
     host: str = Field(default="0.0.0.0", description="Server bind address")
     port: int = Field(default=8000, description="Server port")
@@ -46,11 +57,70 @@ class Settings(BaseSettings):
         default=False,
         description="Allow admin operations across tenants"
     )
+    admin_list_default_limit: int = Field(
+        default=100,
+        description="Default page size for admin list actions"
+    )
+    admin_list_max_limit: int = Field(
+        default=1000,
+        description="Maximum page size for admin list actions"
+    )
+    jwt_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Seconds to cache verified JWTs, capped at token expiry (0 disables)"
+    )
+    jwt_cache_size: int = Field(
+        default=10_000,
+        description="Maximum number of cached verified JWTs"
+    )
+    api_key_pepper: str = Field(
+        default="",
+        description=(
+            "Secret used to derive indexed API key lookup values; required outside debug. "
+            "Rotating it requires clearing api_keys.key_lookup so keys are re-backfilled"
+        )
+    )
+    api_key_bcrypt_rounds: int = Field(
+        default=10,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor for newly hashed API keys"
+    )
+    api_key_last_used_interval_seconds: int = Field(
+        default=60,
+        description="Minimum seconds between last_used_at writes for an API key"
+    )
+    api_key_legacy_scan: bool = Field(
+        default=True,
+        description=(
+            "Scan active keys without a lookup value on lookup misses and backfill them; "
+            "disable once every key has a key_lookup"
+        )
+    )
+    api_key_cache_ttl_seconds: int = Field(
+        default=120,
+        description="Seconds to cache API key verification results (0 disables)"
+    )
+    api_key_cache_size: int = Field(
+        default=10_000,
+        description="Maximum number of cached API key verification results"
+    )
+    auth_cache_ttl_seconds: int = Field(
+        default=5,
+        description="Seconds to reuse a token's authenticated principal across MCP calls (0 disables)"
+    )
+    auth_cache_size: int = Field(
+        default=10_000,
+        description="Maximum number of cached authenticated principals"
+    )
 
     # MetaGate specific
     metagate_version: str = Field(default="0.1", description="MetaGate version")
     default_startup_sla_seconds: int = Field(default=120, description="Default startup SLA in seconds")
     receipt_retention_hours: int = Field(default=72, description="Receipt retention in hours")
+    retention_cleanup_batch_size: int = Field(
+        default=1000, ge=1, description="Startup sessions deleted per retention cleanup transaction"
+    )
 
     # ReceiptGate integration
     receiptgate_endpoint: str = Field(default="", description="ReceiptGate MCP endpoint")
@@ -65,8 +135,9 @@ class Settings(BaseSettings):
     default_deployment_key: str = Field(default="default", description="Default deployment key")
 
     # CORS configuration (explicit allowlist for security)
-    cors_allowed_origins: list[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
+    # A set so CORSMiddleware's per-request origin check is a hash lookup
+    cors_allowed_origins: frozenset[str] = Field(
+        default=frozenset({"http://localhost:3000", "http://localhost:8080"}),
         description="Allowed CORS origins (explicit allowlist for security)"
     )
     cors_allow_credentials: bool = Field(
@@ -87,45 +158,30 @@ class Settings(BaseSettings):
     rate_limit_requests_per_minute: int = Field(default=100, description="Rate limit per minute")
 
     # Validators
-    @field_validator("database_url")
-    @classmethod
-    def validate_database_url(cls, v: str, info: ValidationInfo) -> str:
-        """Validate database URL format."""
-        debug = info.data.get("debug", False)
-        debug_env = os.getenv("METAGATE_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
-        if (debug or debug_env) and v.startswith(("sqlite://", "sqlite+aiosqlite://")):
-            return v
-        if not v.startswith(("postgresql://", "postgresql+asyncpg://")):
-            raise ValueError("database_url must be a PostgreSQL URL (postgresql:// or postgresql+asyncpg://)")
-        return v
-
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
-        """Validate port number range."""
-        if not 1 <= v <= 65535:
-            raise ValueError(f"Port must be between 1 and 65535, got {v}")
-        return v
-
-    @field_validator("jwt_secret")
-    @classmethod
-    def validate_jwt_secret(cls, v: str, info) -> str:
-        """Validate JWT secret is not default in production."""
-        debug = info.data.get("debug", False)
-        if v == "change-me-in-production" and not debug:
+    @model_validator(mode="after")
+    def _validate(self) -> "Settings":
+        """Validate database URL, port, secrets and ReceiptGate endpoint in one pass."""
+        if not (self.debug and self.database_url.startswith(("sqlite://", "sqlite+aiosqlite://"))):
+            if not self.database_url.startswith(("postgresql://", "postgresql+asyncpg://")):
+                raise ValueError(
+                    "database_url must be a PostgreSQL URL (postgresql:// or postgresql+asyncpg://)"
+                )
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"Port must be between 1 and 65535, got {self.port}")
+        if self.jwt_secret == "change-me-in-production" and not self.debug:
             raise ValueError("jwt_secret must be changed from default value in production")
-        return v
-
-    @field_validator("receiptgate_endpoint")
-    @classmethod
-    def validate_receiptgate_endpoint(cls, v: str) -> str:
-        """Validate ReceiptGate endpoint if provided."""
-        if v and not v.startswith(("http://", "https://")):
+        if not self.api_key_pepper and not self.debug:
+            raise ValueError("api_key_pepper must be set in production")
+        if self.receiptgate_endpoint and not self.receiptgate_endpoint.startswith(("http://", "https://")):
             raise ValueError("receiptgate_endpoint must start with http:// or https://")
-        return v
+        return self
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+# Settings are parsed once per process; hot paths import this instead of calling get_settings().
+SETTINGS: Final[Settings] = get_settings()
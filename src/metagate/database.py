@@ -1,31 +1,72 @@
 """Database connection and session management."""
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncGenerator
+from sqlalchemy.pool import NullPool
+from typing import Any, AsyncGenerator
+
+import orjson
 
 from .config import get_settings
 
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base."""
-    pass
+
+    # Fetch server-generated columns (created_at/updated_at) with INSERT ... RETURNING
+    # so freshly created rows can be serialized without a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 settings = get_settings()
 
-engine_kwargs = {"echo": settings.debug}
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
+engine_kwargs = {
+    "echo": settings.debug,
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
+}
+if settings.database_url.startswith("postgresql+asyncpg://"):
+    connect_args: dict[str, Any]
+    if settings.db_pgbouncer:
+        # Transaction pooling can hand each statement a different server connection,
+        # so prepared statements must not be cached client-side. PgBouncer rejects
+        # unknown startup parameters, so jit is turned off on the role instead.
+        connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    else:
+        # MetaGate runs short OLTP queries, where JIT compilation only adds planning time.
+        connect_args = {"server_settings": {"jit": "off"}}
+    engine_kwargs["connect_args"] = connect_args
+
 if settings.database_url.startswith(("sqlite://", "sqlite+aiosqlite://")):
     engine = create_async_engine(
         settings.database_url,
         **engine_kwargs,
     )
+elif settings.db_pgbouncer:
+    # PgBouncer owns pooling; a second pool in each worker would only pin server slots.
+    engine = create_async_engine(
+        settings.database_url,
+        **engine_kwargs,
+        poolclass=NullPool,
+    )
 else:
+    # Pre-ping costs a round trip on every checkout, so it is off by default; stale
+    # connections are bounded by pool_recycle instead. LIFO checkout keeps the hot
+    # connections busy and lets surplus idle ones age out.
     engine = create_async_engine(
         settings.database_url,
         **engine_kwargs,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_use_lifo=settings.db_pool_use_lifo,
     )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -38,7 +79,4 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session."""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
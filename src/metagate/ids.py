@@ -0,0 +1,46 @@
+"""Identifier generation for MetaGate rows."""
+import os
+import threading
+import time
+import uuid
+
+_UUID7_VERSION_BITS = 0x7 << 76
+_UUID_VARIANT_BITS = 0b10 << 62
+_RAND_B_MASK = (1 << 62) - 1
+_COUNTER_MAX = 0xFFF
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits carry the Unix timestamp in milliseconds, so primary keys
+    generated over time land on the rightmost B-tree leaf instead of random pages.
+    The 12-bit ``rand_a`` field is used as a counter within a millisecond, keeping
+    identifiers from one process strictly increasing.
+    """
+    global _last_ms, _counter
+    rand = int.from_bytes(os.urandom(8), "big")
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_ms:
+            _last_ms = timestamp_ms
+            _counter = rand >> 53  # random start, leaving headroom below _COUNTER_MAX
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms = _last_ms
+        counter = _counter
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | _UUID7_VERSION_BITS
+        | counter << 64
+        | _UUID_VARIANT_BITS
+        | rand & _RAND_B_MASK
+    )
+    return uuid.UUID(int=value)
@@ -4,15 +4,17 @@ This module provides JSON-formatted structured logging with trace IDs
 for production observability and easier log parsing.
 """
 import logging
+import os
 import sys
-import uuid
 from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
-from .config import get_settings
+from .config import SETTINGS
 
 # Context variable for request trace ID
 trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
@@ -26,32 +28,49 @@ def get_trace_id() -> str | None:
 def set_trace_id(trace_id: str | None = None) -> str:
     """Set a trace ID in context, generating one if not provided."""
     if trace_id is None:
-        trace_id = str(uuid.uuid4())[:8]
+        trace_id = os.urandom(4).hex()
     trace_id_var.set(trace_id)
+    # merge_contextvars copies bound values into every event, so no extra processor is needed
+    structlog.contextvars.bind_contextvars(trace_id=trace_id)
     return trace_id
 
 
-def add_trace_id(
-    logger: logging.Logger, method_name: str, event_dict: dict[str, Any]
-) -> dict[str, Any]:
-    """Add trace ID to log events."""
-    trace_id = get_trace_id()
-    if trace_id:
-        event_dict["trace_id"] = trace_id
-    return event_dict
+# Service metadata never changes at runtime, so it is built once and merged per event.
+_SERVICE_FIELDS = MappingProxyType({
+    "service": "metagate",
+    "version": SETTINGS.metagate_version,
+    "instance_id": SETTINGS.instance_id,
+})
 
 
 def add_service_info(
     logger: logging.Logger, method_name: str, event_dict: dict[str, Any]
 ) -> dict[str, Any]:
     """Add service metadata to log events."""
-    settings = get_settings()
-    event_dict["service"] = "metagate"
-    event_dict["version"] = settings.metagate_version
-    event_dict["instance_id"] = settings.instance_id
+    event_dict.update(_SERVICE_FIELDS)
     return event_dict
 
 
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, keeping structlog's fallback handler."""
+    return orjson.dumps(
+        value, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+# Common processors for all environments
+_SHARED_PROCESSORS: list[Processor] = [
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    add_service_info,
+]
+if SETTINGS.debug:
+    # Nothing logs raw bytes, and stack_info is only useful while developing.
+    _SHARED_PROCESSORS.append(structlog.processors.StackInfoRenderer())
+
+
 def configure_logging() -> structlog.stdlib.BoundLogger:
     """Configure structured logging based on environment.
 
@@ -61,44 +80,23 @@ def configure_logging() -> structlog.stdlib.BoundLogger:
     Returns:
         Configured structlog logger instance
     """
-    settings = get_settings()
-
-    # Common processors for all environments
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
-        add_trace_id,
-        add_service_info,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
-
-    if settings.debug:
+    if SETTINGS.debug:
         # Development: human-readable console output
-        processors: list[Processor] = shared_processors + [
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ]
-        formatter = structlog.stdlib.ProcessorFormatter(
-            foreign_pre_chain=shared_processors,
-            processors=[
-                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                structlog.dev.ConsoleRenderer(colors=True),
-            ],
-        )
+        renderer: Processor = structlog.dev.ConsoleRenderer(colors=True)
     else:
         # Production: JSON output for log aggregation systems
-        processors = shared_processors + [
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ]
-        formatter = structlog.stdlib.ProcessorFormatter(
-            foreign_pre_chain=shared_processors,
-            processors=[
-                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                structlog.processors.JSONRenderer(),
-            ],
-        )
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+    processors: list[Processor] = _SHARED_PROCESSORS + [
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ]
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=_SHARED_PROCESSORS,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            renderer,
+        ],
+    )
 
     # Configure structlog
     structlog.configure(
@@ -116,7 +114,7 @@ def configure_logging() -> structlog.stdlib.BoundLogger:
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.addHandler(handler)
-    root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+    root_logger.setLevel(logging.DEBUG if SETTINGS.debug else logging.INFO)
 
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -130,6 +128,10 @@ def configure_logging() -> structlog.stdlib.BoundLogger:
 def get_logger(name: str = "metagate") -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance.
 
+    Call this once at module scope (``logger = get_logger(__name__)``) rather than
+    inside handlers; with ``cache_logger_on_first_use`` the module-level proxy is
+    resolved once and reused for every later call.
+
     Args:
         name: Logger name for categorization
 
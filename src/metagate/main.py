@@ -5,16 +5,21 @@ MetaGate is the first flame.
 MetaGate is a non-blocking, describe-only bootstrap authority that provides
 world truth to components before they participate in a distributed system.
 """
-from fastapi import FastAPI, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
+import random
 
+from .auth.auth import PrebuiltHTTPException
 from .config import get_settings
 from .logging import configure_logging, get_logger, set_trace_id
 from .mcp.routes import router as mcp_router
-from .middleware import get_rate_limiter
+from .middleware import RateLimiter
+from .receiptgate_client import close_client as close_receiptgate_client
+from .responses import ORJSONResponse
+from .services.audit import ensure_audit_partitions
 from .services.bootstrap import cleanup_old_sessions
 from .database import AsyncSessionLocal
 
@@ -24,30 +29,32 @@ settings = get_settings()
 logger = configure_logging()
 
 
-# Rate limiting dependency
-async def rate_limit_dependency(request: Request) -> None:
-    """Rate limiting dependency."""
-    limiter = get_rate_limiter(
-        calls_per_minute=settings.rate_limit_requests_per_minute,
-        enabled=settings.rate_limit_enabled
-    )
-    await limiter.check_request(request)
-
-
 async def retention_cleanup_task():
-    """Background task that periodically cleans up old startup sessions."""
+    """Background task that cleans up old startup sessions and pre-creates audit partitions."""
     cleanup_interval = 3600  # Run every hour
+    cleanup_jitter = 300  # Spread instances out so they do not clean up in lockstep
+    batch_size = settings.retention_cleanup_batch_size
     while True:
         try:
-            await asyncio.sleep(cleanup_interval)
+            await asyncio.sleep(cleanup_interval + random.uniform(0, cleanup_jitter))
+            deleted = 0
             async with AsyncSessionLocal() as db:
-                deleted = await cleanup_old_sessions(db, settings.receipt_retention_hours)
+                # Delete in bounded batches so each transaction holds its locks briefly
+                while True:
+                    batch_deleted = await cleanup_old_sessions(
+                        db, settings.receipt_retention_hours, batch_size=batch_size
+                    )
+                    deleted += batch_deleted
+                    if batch_deleted < batch_size:
+                        break
                 if deleted > 0:
                     logger.info(
                         "retention_cleanup_completed",
                         deleted_sessions=deleted,
                         retention_hours=settings.receipt_retention_hours,
                     )
+                # Keep next month's audit partition ahead of the first write into it
+                await ensure_audit_partitions(db)
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -78,6 +85,8 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    await close_receiptgate_client()
+
     logger.info("metagate_shutdown", version=settings.metagate_version)
 
 
@@ -111,6 +120,13 @@ MetaGate is truth, not control.
     """,
     version=settings.metagate_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Rate limiter shared by the MCP entry point, built once from settings
+app.state.rate_limiter = RateLimiter(
+    calls_per_minute=settings.rate_limit_requests_per_minute,
+    enabled=settings.rate_limit_enabled,
 )
 
 # CORS middleware
@@ -137,23 +153,36 @@ async def trace_id_middleware(request: Request, call_next):
     return response
 
 
+@app.exception_handler(PrebuiltHTTPException)
+async def prebuilt_http_exception_handler(request: Request, exc: PrebuiltHTTPException):
+    """Return static auth errors from their pre-serialized bodies."""
+    return Response(
+        content=exc.body,
+        status_code=exc.status_code,
+        headers=exc.headers,
+        media_type="application/json",
+    )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.exception(
+    error = str(exc)
+    logger.error(
         "unhandled_exception",
-        error=str(exc),
+        error=error,
         path=request.url.path,
         method=request.method,
+        exc_info=exc,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "detail": str(exc) if settings.debug else None,
+            "detail": error if settings.debug else None,
         },
     )
 
 
-# Include MCP router (with rate limiting)
-app.include_router(mcp_router, dependencies=[Depends(rate_limit_dependency)])
+# Include MCP router (rate limited per call inside the MCP entry point)
+app.include_router(mcp_router)
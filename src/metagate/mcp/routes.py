@@ -2,26 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
+import hashlib
+import re
+import time
 
-from fastapi import APIRouter, Request
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from fastapi import APIRouter, Request, Response
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import delete, select, update
 
 from metagate.auth.auth import (
     AuthenticatedPrincipal,
-    is_admin_principal,
+    auth_cache,
+    looks_like_jwt,
     verify_api_key,
     verify_jwt,
 )
-from metagate.config import get_settings
+from metagate.auth.verification_cache import MISSING
+from metagate.config import SETTINGS
 from metagate.database import AsyncSessionLocal
-from metagate.middleware import get_rate_limiter
-from metagate.models.db_models import Principal, Profile, Manifest, Binding, SecretRef
+from metagate.ids import uuid7
+from metagate.responses import ORJSONResponse
+from metagate.models.db_models import AuditAction, Principal, Profile, Manifest, Binding, SecretRef
 from metagate.models.schemas import (
     BootstrapRequest,
     DiscoveryResponse,
+    HealthResponse,
     PrincipalCreate,
     PrincipalResponse,
     ProfileCreate,
@@ -32,19 +42,39 @@ from metagate.models.schemas import (
     BindingResponse,
     SecretRefCreate,
     SecretRefResponse,
+    OnboardCreate,
 )
-from metagate.services.bootstrap import BootstrapError, ForbiddenKeyError, perform_bootstrap
+from metagate.services.bootstrap import (
+    BootstrapError,
+    ForbiddenKeyError,
+    check_forbidden_keys,
+    perform_bootstrap,
+)
+from metagate.services.audit import AuditBuffer
 from metagate.services.startup import StartupError, mark_startup_failed, mark_startup_ready
-from metagate.tenancy import apply_tenant_scope, resolve_tenant_key
+from metagate.tenancy import apply_tenant_scope, get_in_tenant_scope, resolve_tenant_key
 
 
-class MCPRequest(BaseModel):
+@dataclass(slots=True)
+class MCPRequest:
     """JSON-RPC request envelope for MCP."""
 
-    jsonrpc: str = Field(default="2.0")
     method: str
-    params: dict[str, Any] = Field(default_factory=dict)
+    params: dict[str, Any] = field(default_factory=dict)
     id: Any = None
+    jsonrpc: str = "2.0"
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> Optional[MCPRequest]:
+        """Build an envelope from a decoded JSON object, or None if it is malformed."""
+        method = payload.get("method")
+        params = payload.get("params")
+        jsonrpc = payload.get("jsonrpc", "2.0")
+        if params is None:
+            params = {}
+        if not isinstance(method, str) or not isinstance(params, dict) or not isinstance(jsonrpc, str):
+            return None
+        return cls(method=method, params=params, id=payload.get("id"), jsonrpc=jsonrpc)
 
 
 def _jsonrpc_result(request_id: Any, result: Any) -> dict[str, Any]:
@@ -133,93 +163,214 @@ MCP_TOOLS = [
         "description": "Manage secret references",
         "inputSchema": {"type": "object", "properties": {}},
     },
+    {
+        "name": "metagate.admin_onboard",
+        "description": "Create a principal, profile, manifest and binding in one transaction",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "principal": {"type": "object"},
+                "profile": {"type": "object"},
+                "manifest": {"type": "object"},
+                "overrides": {"type": "object"},
+                "tenant_key": {"type": "string"},
+                "auth_token": {"type": "string"},
+            },
+            "required": ["principal", "profile", "manifest"],
+        },
+    },
 ]
 
 
 router = APIRouter(prefix="/mcp", tags=["mcp"])
 
+# Discovery and health data are fixed for the process lifetime; build them once instead of per call.
+_DISCOVERY_RESULT = DiscoveryResponse(
+    metagate_version=SETTINGS.metagate_version,
+    bootstrap_endpoint="/mcp",
+    supported_auth=["jwt", "api_key"],
+).model_dump()
+_HEALTH_RESULT = HealthResponse(
+    status="healthy",
+    version=SETTINGS.metagate_version,
+    instance_id=SETTINGS.instance_id,
+).model_dump()
+
+# Pre-serialized results for calls whose answer never changes; only the request id is
+# encoded per call. Probe and discovery traffic served this way is never rate limited.
+_TOOLS_LIST_BYTES = orjson.dumps({"tools": MCP_TOOLS})
+_STATIC_TOOL_BYTES = {
+    "metagate.discovery": orjson.dumps(_DISCOVERY_RESULT),
+    "metagate.health": orjson.dumps(_HEALTH_RESULT),
+}
+
+
+def _static_result(payload: dict[str, Any]) -> Optional[bytes]:
+    method = payload.get("method")
+    if method == "tools/list":
+        return _TOOLS_LIST_BYTES
+    if method == "tools/call":
+        params = payload.get("params")
+        name = params.get("name") if isinstance(params, dict) else None
+        if isinstance(name, str):
+            return _STATIC_TOOL_BYTES.get(name)
+    return None
+
+
+def _jsonrpc_result_response(request_id: Any, result: bytes) -> Response:
+    return Response(
+        content=b'{"jsonrpc":"2.0","id":' + orjson.dumps(request_id) + b',"result":' + result + b"}",
+        media_type="application/json",
+    )
+
+
+_BEARER_RE = re.compile(r"bearer\s+(\S.*)", re.IGNORECASE)
+
 
 def _extract_auth_token(arguments: dict[str, Any], request: Request) -> Optional[str]:
     token = arguments.pop("auth_token", None)
     if token:
         return token
     auth_header = request.headers.get("authorization")
-    api_key_header = request.headers.get("x-api-key")
-    if auth_header and auth_header.lower().startswith("bearer "):
-        return auth_header.split(" ", 1)[1]
-    if api_key_header:
-        return api_key_header
-    return None
+    if auth_header:
+        match = _BEARER_RE.match(auth_header)
+        if match:
+            return match.group(1)
+    return request.headers.get("x-api-key") or None
 
 
-async def _rate_limit(request: Request) -> None:
-    settings = get_settings()
-    limiter = get_rate_limiter(
-        calls_per_minute=settings.rate_limit_requests_per_minute,
-        enabled=settings.rate_limit_enabled,
-    )
-    await limiter.check_request(request)
+def _parse_uuid(value: Any, name: str) -> UUID:
+    """Parse an id argument, reporting a malformed value by argument name."""
+    try:
+        return UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError(f"{name} must be a valid UUID") from None
 
 
 async def _authenticate(
     db,
-    token: Optional[str],
+    token: str,
 ) -> AuthenticatedPrincipal:
-    if not token:
-        raise ValueError("Missing auth token")
-    auth = await verify_jwt(token, db)
-    if not auth:
+    token_hash = hashlib.sha256(token.encode()).digest()
+    snapshot = auth_cache.get(token_hash)
+    if snapshot is not MISSING:
+        # Only plain field values are cached; each call gets its own transient principal
+        # rather than sharing an ORM instance across sessions.
+        return AuthenticatedPrincipal.from_snapshot(snapshot)
+
+    # Tokens are dispatched by shape, so API keys never pay for a JWT decode.
+    if looks_like_jwt(token):
+        auth = await verify_jwt(token, db)
+    else:
         auth = await verify_api_key(token, db)
     if not auth or not auth.principal:
         raise ValueError("Invalid authentication credentials")
+    ttl = auth_cache.ttl
+    if auth.expires_at is not None:
+        ttl = min(ttl, auth.expires_at - time.time())
+    if ttl > 0:
+        auth_cache.set(token_hash, auth.snapshot(), ttl=ttl)
     return auth
 
 
+async def _delete_in_tenant_scope(db, auth: AuthenticatedPrincipal, model, object_id: UUID) -> bool:
+    """Delete a row by id in one statement, returning whether a row was removed."""
+    stmt = apply_tenant_scope(delete(model).where(model.id == object_id), auth, model)
+    result = await db.execute(stmt.returning(model.id))
+    return result.scalar_one_or_none() is not None
+
+
+@cache
+def _response_fields(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(model_cls.model_fields)
+
+
+def _row_to_resp(model_cls: type[BaseModel], row: Any) -> dict[str, Any]:
+    """Copy a trusted ORM row's response fields into a plain dict.
+
+    UUIDs and datetimes are left as-is; ORJSONResponse encodes them natively, so
+    pydantic is not involved on egress.
+    """
+    return {name: getattr(row, name) for name in _response_fields(model_cls)}
+
+
+def _create_columns(create: BaseModel) -> dict[str, Any]:
+    """Return a validated create payload's column values, without its tenant key.
+
+    Fields are read straight off the model instead of through ``model_dump``, so nested
+    JSON values are handed to the ORM without being copied.
+    """
+    return {name: value for name, value in create if name != "tenant_key"}
+
+
+# Manifest fields that are screened for secret-looking keys before they are stored.
+MANIFEST_CONFIG_FIELDS = ("environment", "services", "memory_map", "polling", "schemas")
+
+DEFAULT_PAGE_SIZE = SETTINGS.admin_list_default_limit
+MAX_PAGE_SIZE = SETTINGS.admin_list_max_limit
+
+
+async def _list_page(
+    db,
+    model,
+    response_cls: type[BaseModel],
+    tenant_key: str,
+    arguments: dict[str, Any],
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Fetch one keyset page of tenant rows ordered by id, plus the cursor for the next page.
+
+    Only the response columns are selected and rows come back as plain dicts, so no
+    ORM instances are built for list responses.
+    """
+    limit = arguments.get("limit", DEFAULT_PAGE_SIZE)
+    if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be an integer between 1 and {MAX_PAGE_SIZE}")
+    columns = [getattr(model, name) for name in _response_fields(response_cls)]
+    query = select(*columns).where(model.tenant_key == tenant_key)
+    cursor = arguments.get("cursor")
+    if cursor:
+        query = query.where(model.id > _parse_uuid(cursor, "cursor"))
+    # Fetch one extra row to learn whether another page exists.
+    result = await db.execute(query.order_by(model.id).limit(limit + 1))
+    rows = [dict(row) for row in result.mappings()]
+    if len(rows) > limit:
+        return rows[:limit], str(rows[limit - 1]["id"])
+    return rows, None
+
+
 async def _handle_admin_principals(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
     action = arguments.get("action", "list")
     if action == "create":
         data = arguments.get("data") or arguments
-        create = PrincipalCreate(**data)
-        tenant_key = resolve_tenant_key(auth, create.tenant_key)
-        principal = Principal(
-            tenant_key=tenant_key,
-            principal_key=create.principal_key,
-            auth_subject=create.auth_subject,
-            principal_type=create.principal_type,
-        )
+        create = PrincipalCreate.model_validate(data)
+        principal = Principal(tenant_key=resolve_tenant_key(auth, create.tenant_key), **_create_columns(create))
         db.add(principal)
         await db.commit()
-        await db.refresh(principal)
-        return PrincipalResponse.model_validate(principal).model_dump()
+        return _row_to_resp(PrincipalResponse, principal)
 
     if action == "list":
         tenant_key = resolve_tenant_key(auth, arguments.get("tenant_key"))
-        result = await db.execute(select(Principal).where(Principal.tenant_key == tenant_key))
-        return {"principals": [PrincipalResponse.model_validate(p).model_dump() for p in result.scalars().all()]}
+        rows, next_cursor = await _list_page(db, Principal, PrincipalResponse, tenant_key, arguments)
+        return {
+            "principals": rows,
+            "next_cursor": next_cursor,
+        }
 
     if action == "get":
         principal_id = arguments.get("principal_id")
         if not principal_id:
             raise ValueError("principal_id is required")
-        query = select(Principal).where(Principal.id == UUID(principal_id))
-        query = apply_tenant_scope(query, auth, Principal)
-        result = await db.execute(query)
-        principal = result.scalar_one_or_none()
+        principal = await get_in_tenant_scope(db, auth, Principal, _parse_uuid(principal_id, "principal_id"))
         if not principal:
             raise ValueError("Principal not found")
-        return PrincipalResponse.model_validate(principal).model_dump()
+        return _row_to_resp(PrincipalResponse, principal)
 
     if action == "delete":
         principal_id = arguments.get("principal_id")
         if not principal_id:
             raise ValueError("principal_id is required")
-        query = select(Principal).where(Principal.id == UUID(principal_id))
-        query = apply_tenant_scope(query, auth, Principal)
-        result = await db.execute(query)
-        principal = result.scalar_one_or_none()
-        if not principal:
+        if not await _delete_in_tenant_scope(db, auth, Principal, _parse_uuid(principal_id, "principal_id")):
             raise ValueError("Principal not found")
-        await db.delete(principal)
         await db.commit()
         return {"deleted": True}
 
@@ -230,52 +381,42 @@ async def _handle_admin_profiles(db, auth: AuthenticatedPrincipal, arguments: di
     action = arguments.get("action", "list")
     if action == "create":
         data = arguments.get("data") or arguments
-        create = ProfileCreate(**data)
-        tenant_key = resolve_tenant_key(auth, create.tenant_key)
-        profile = Profile(
-            tenant_key=tenant_key,
-            profile_key=create.profile_key,
-            capabilities=create.capabilities,
-            policy=create.policy,
-            startup_sla_seconds=create.startup_sla_seconds,
-        )
+        create = ProfileCreate.model_validate(data)
+        profile = Profile(tenant_key=resolve_tenant_key(auth, create.tenant_key), **_create_columns(create))
         db.add(profile)
         await db.commit()
-        await db.refresh(profile)
-        return ProfileResponse.model_validate(profile).model_dump()
+        return _row_to_resp(ProfileResponse, profile)
 
     if action == "list":
         tenant_key = resolve_tenant_key(auth, arguments.get("tenant_key"))
-        result = await db.execute(select(Profile).where(Profile.tenant_key == tenant_key))
-        return {"profiles": [ProfileResponse.model_validate(p).model_dump() for p in result.scalars().all()]}
+        rows, next_cursor = await _list_page(db, Profile, ProfileResponse, tenant_key, arguments)
+        return {
+            "profiles": rows,
+            "next_cursor": next_cursor,
+        }
 
     if action == "get":
         profile_id = arguments.get("profile_id")
         profile_key = arguments.get("profile_key")
         if profile_id:
-            query = select(Profile).where(Profile.id == UUID(profile_id))
+            profile = await get_in_tenant_scope(db, auth, Profile, _parse_uuid(profile_id, "profile_id"))
         elif profile_key:
             query = select(Profile).where(Profile.profile_key == profile_key)
+            query = apply_tenant_scope(query, auth, Profile)
+            result = await db.execute(query)
+            profile = result.scalar_one_or_none()
         else:
             raise ValueError("profile_id or profile_key is required")
-        query = apply_tenant_scope(query, auth, Profile)
-        result = await db.execute(query)
-        profile = result.scalar_one_or_none()
         if not profile:
             raise ValueError("Profile not found")
-        return ProfileResponse.model_validate(profile).model_dump()
+        return _row_to_resp(ProfileResponse, profile)
 
     if action == "delete":
         profile_id = arguments.get("profile_id")
         if not profile_id:
             raise ValueError("profile_id is required")
-        query = select(Profile).where(Profile.id == UUID(profile_id))
-        query = apply_tenant_scope(query, auth, Profile)
-        result = await db.execute(query)
-        profile = result.scalar_one_or_none()
-        if not profile:
+        if not await _delete_in_tenant_scope(db, auth, Profile, _parse_uuid(profile_id, "profile_id")):
             raise ValueError("Profile not found")
-        await db.delete(profile)
         await db.commit()
         return {"deleted": True}
 
@@ -286,109 +427,118 @@ async def _handle_admin_manifests(db, auth: AuthenticatedPrincipal, arguments: d
     action = arguments.get("action", "list")
     if action == "create":
         data = arguments.get("data") or arguments
-        create = ManifestCreate(**data)
+        create = ManifestCreate.model_validate(data)
         tenant_key = resolve_tenant_key(auth, create.tenant_key)
-        manifest = Manifest(
-            tenant_key=tenant_key,
-            manifest_key=create.manifest_key,
-            deployment_key=create.deployment_key,
-            environment=create.environment,
-            services=create.services,
-            memory_map=create.memory_map,
-            polling=create.polling,
-            schemas=create.schemas,
-            version=create.version,
-        )
+        columns = _create_columns(create)
+        forbidden = check_forbidden_keys({name: columns[name] for name in MANIFEST_CONFIG_FIELDS})
+        if forbidden:
+            raise ForbiddenKeyError(forbidden)
+        manifest = Manifest(tenant_key=tenant_key, **columns)
         db.add(manifest)
         await db.commit()
-        await db.refresh(manifest)
-        return ManifestResponse.model_validate(manifest).model_dump()
+        return _row_to_resp(ManifestResponse, manifest)
 
     if action == "list":
         tenant_key = resolve_tenant_key(auth, arguments.get("tenant_key"))
-        result = await db.execute(select(Manifest).where(Manifest.tenant_key == tenant_key))
-        return {"manifests": [ManifestResponse.model_validate(m).model_dump() for m in result.scalars().all()]}
+        rows, next_cursor = await _list_page(db, Manifest, ManifestResponse, tenant_key, arguments)
+        return {
+            "manifests": rows,
+            "next_cursor": next_cursor,
+        }
 
     if action == "get":
         manifest_id = arguments.get("manifest_id")
         manifest_key = arguments.get("manifest_key")
         if manifest_id:
-            query = select(Manifest).where(Manifest.id == UUID(manifest_id))
+            manifest = await get_in_tenant_scope(db, auth, Manifest, _parse_uuid(manifest_id, "manifest_id"))
         elif manifest_key:
             query = select(Manifest).where(Manifest.manifest_key == manifest_key)
+            query = apply_tenant_scope(query, auth, Manifest)
+            result = await db.execute(query)
+            manifest = result.scalar_one_or_none()
         else:
             raise ValueError("manifest_id or manifest_key is required")
-        query = apply_tenant_scope(query, auth, Manifest)
-        result = await db.execute(query)
-        manifest = result.scalar_one_or_none()
         if not manifest:
             raise ValueError("Manifest not found")
-        return ManifestResponse.model_validate(manifest).model_dump()
+        return _row_to_resp(ManifestResponse, manifest)
 
     if action == "delete":
         manifest_id = arguments.get("manifest_id")
         if not manifest_id:
             raise ValueError("manifest_id is required")
-        query = select(Manifest).where(Manifest.id == UUID(manifest_id))
-        query = apply_tenant_scope(query, auth, Manifest)
-        result = await db.execute(query)
-        manifest = result.scalar_one_or_none()
-        if not manifest:
+        if not await _delete_in_tenant_scope(db, auth, Manifest, _parse_uuid(manifest_id, "manifest_id")):
             raise ValueError("Manifest not found")
-        await db.delete(manifest)
         await db.commit()
         return {"deleted": True}
 
     raise ValueError(f"Unsupported action: {action}")
 
 
+async def _verify_binding_targets(db, create: BindingCreate, tenant_key: str) -> None:
+    """Check that a binding's principal, profile and manifest exist in one round-trip."""
+    targets = (
+        ("Principal", Principal, create.principal_id),
+        ("Profile", Profile, create.profile_id),
+        ("Manifest", Manifest, create.manifest_id),
+    )
+    result = await db.execute(
+        select(*(
+            select(model.id).where(model.id == target_id, model.tenant_key == tenant_key).exists()
+            for _, model, target_id in targets
+        ))
+    )
+    for (label, _, _), found in zip(targets, result.one()):
+        if not found:
+            raise ValueError(f"{label} not found")
+
+
 async def _handle_admin_bindings(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
     action = arguments.get("action", "list")
     if action == "create":
         data = arguments.get("data") or arguments
-        create = BindingCreate(**data)
+        create = BindingCreate.model_validate(data)
         tenant_key = resolve_tenant_key(auth, create.tenant_key)
-        binding = Binding(
-            tenant_key=tenant_key,
-            principal_id=create.principal_id,
-            profile_id=create.profile_id,
-            manifest_id=create.manifest_id,
-            overrides=create.overrides,
-            active=create.active,
-        )
+        await _verify_binding_targets(db, create, tenant_key)
+        if create.active:
+            # A principal has at most one active binding; retire the old ones in one statement.
+            await db.execute(
+                update(Binding)
+                .where(
+                    Binding.principal_id == create.principal_id,
+                    Binding.tenant_key == tenant_key,
+                    Binding.active.is_(True),
+                )
+                .values(active=False)
+                .execution_options(synchronize_session=False)
+            )
+        binding = Binding(tenant_key=tenant_key, **_create_columns(create))
         db.add(binding)
         await db.commit()
-        await db.refresh(binding)
-        return BindingResponse.model_validate(binding).model_dump()
+        return _row_to_resp(BindingResponse, binding)
 
     if action == "list":
         tenant_key = resolve_tenant_key(auth, arguments.get("tenant_key"))
-        result = await db.execute(select(Binding).where(Binding.tenant_key == tenant_key))
-        return {"bindings": [BindingResponse.model_validate(b).model_dump() for b in result.scalars().all()]}
+        rows, next_cursor = await _list_page(db, Binding, BindingResponse, tenant_key, arguments)
+        return {
+            "bindings": rows,
+            "next_cursor": next_cursor,
+        }
 
     if action == "get":
         binding_id = arguments.get("binding_id")
         if not binding_id:
             raise ValueError("binding_id is required")
-        query = select(Binding).where(Binding.id == UUID(binding_id))
-        query = apply_tenant_scope(query, auth, Binding)
-        result = await db.execute(query)
-        binding = result.scalar_one_or_none()
+        binding = await get_in_tenant_scope(db, auth, Binding, _parse_uuid(binding_id, "binding_id"))
         if not binding:
             raise ValueError("Binding not found")
-        return BindingResponse.model_validate(binding).model_dump()
+        return _row_to_resp(BindingResponse, binding)
 
     if action == "delete":
         binding_id = arguments.get("binding_id")
         if not binding_id:
             raise ValueError("binding_id is required")
-        query = select(Binding).where(Binding.id == UUID(binding_id))
-        query = apply_tenant_scope(query, auth, Binding)
-        result = await db.execute(query)
-        binding = result.scalar_one_or_none()
-        if not binding:
+        if not await _delete_in_tenant_scope(db, auth, Binding, _parse_uuid(binding_id, "binding_id")):
             raise ValueError("Binding not found")
-        await db.delete(binding)
         await db.commit()
         return {"deleted": True}
 
@@ -399,128 +549,199 @@ async def _handle_admin_secret_refs(db, auth: AuthenticatedPrincipal, arguments:
     action = arguments.get("action", "list")
     if action == "create":
         data = arguments.get("data") or arguments
-        create = SecretRefCreate(**data)
-        tenant_key = resolve_tenant_key(auth, create.tenant_key)
-        secret_ref = SecretRef(
-            tenant_key=tenant_key,
-            secret_key=create.secret_key,
-            ref_kind=create.ref_kind,
-            ref_name=create.ref_name,
-            ref_meta=create.ref_meta,
-        )
+        create = SecretRefCreate.model_validate(data)
+        secret_ref = SecretRef(tenant_key=resolve_tenant_key(auth, create.tenant_key), **_create_columns(create))
         db.add(secret_ref)
         await db.commit()
-        await db.refresh(secret_ref)
-        return SecretRefResponse.model_validate(secret_ref).model_dump()
+        return _row_to_resp(SecretRefResponse, secret_ref)
 
     if action == "list":
         tenant_key = resolve_tenant_key(auth, arguments.get("tenant_key"))
-        result = await db.execute(select(SecretRef).where(SecretRef.tenant_key == tenant_key))
-        return {"secret_refs": [SecretRefResponse.model_validate(s).model_dump() for s in result.scalars().all()]}
+        rows, next_cursor = await _list_page(db, SecretRef, SecretRefResponse, tenant_key, arguments)
+        return {
+            "secret_refs": rows,
+            "next_cursor": next_cursor,
+        }
 
     if action == "delete":
         secret_ref_id = arguments.get("secret_ref_id")
         if not secret_ref_id:
             raise ValueError("secret_ref_id is required")
-        query = select(SecretRef).where(SecretRef.id == UUID(secret_ref_id))
-        query = apply_tenant_scope(query, auth, SecretRef)
-        result = await db.execute(query)
-        secret_ref = result.scalar_one_or_none()
-        if not secret_ref:
+        if not await _delete_in_tenant_scope(db, auth, SecretRef, _parse_uuid(secret_ref_id, "secret_ref_id")):
             raise ValueError("Secret ref not found")
-        await db.delete(secret_ref)
         await db.commit()
         return {"deleted": True}
 
     raise ValueError(f"Unsupported action: {action}")
 
 
-async def _handle_tool(name: str, arguments: dict[str, Any], request: Request) -> dict[str, Any]:
-    settings = get_settings()
-    if name == "metagate.discovery":
-        response = DiscoveryResponse(
-            metagate_version=settings.metagate_version,
-            bootstrap_endpoint="/mcp",
-            supported_auth=["jwt", "api_key"],
+async def _handle_admin_onboard(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
+    data = arguments.get("data") or arguments
+    create = OnboardCreate.model_validate(data)
+    tenant_key = resolve_tenant_key(auth, create.tenant_key)
+    manifest_columns = _create_columns(create.manifest)
+    forbidden = check_forbidden_keys({name: manifest_columns[name] for name in MANIFEST_CONFIG_FIELDS})
+    if forbidden:
+        raise ForbiddenKeyError(forbidden)
+
+    # Ids are assigned up front so the audit entries can reference them before the flush.
+    principal = Principal(id=uuid7(), tenant_key=tenant_key, **_create_columns(create.principal))
+    profile = Profile(id=uuid7(), tenant_key=tenant_key, **_create_columns(create.profile))
+    manifest = Manifest(id=uuid7(), tenant_key=tenant_key, **manifest_columns)
+    # The unit of work inserts parents first and fills the binding's foreign keys,
+    # so all four rows go out in one flush and one commit.
+    binding = Binding(
+        id=uuid7(),
+        tenant_key=tenant_key,
+        principal=principal,
+        profile=profile,
+        manifest=manifest,
+        overrides=create.overrides,
+        active=True,
+    )
+    db.add(binding)
+
+    audit = AuditBuffer()
+    actor = auth.principal_key or auth.auth_subject
+    for resource_type, resource_id, resource_key in (
+        ("principal", principal.id, principal.principal_key),
+        ("profile", profile.id, profile.profile_key),
+        ("manifest", manifest.id, manifest.manifest_key),
+        ("binding", binding.id, None),
+    ):
+        audit.add(
+            action=AuditAction.CREATE,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            resource_key=resource_key,
+            actor_principal_key=actor,
+            tenant_key=tenant_key,
+            metadata={"operation": "admin_onboard"},
+        )
+    await audit.flush(db)
+    await db.commit()
+    return {
+        "principal": _row_to_resp(PrincipalResponse, principal),
+        "profile": _row_to_resp(ProfileResponse, profile),
+        "manifest": _row_to_resp(ManifestResponse, manifest),
+        "binding": _row_to_resp(BindingResponse, binding),
+    }
+
+
+async def _handle_bootstrap(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
+    request_model = BootstrapRequest(**arguments)
+    try:
+        packet, is_cached = await perform_bootstrap(
+            db=db,
+            principal=auth.principal,
+            component_key=request_model.component_key,
+            principal_key_hint=request_model.principal_key,
+            last_packet_etag=request_model.last_packet_etag,
+        )
+    except ForbiddenKeyError as exc:
+        raise ValueError(exc.message)
+    except BootstrapError as exc:
+        raise ValueError(exc.message)
+
+    if is_cached:
+        return {"not_modified": True}
+    return {"packet": packet.model_dump(), "packet_etag": packet.packet_etag}
+
+
+async def _handle_startup_ready(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
+    try:
+        response = await mark_startup_ready(
+            db=db,
+            startup_id=_parse_uuid(arguments["startup_id"], "startup_id"),
+            build_version=arguments["build_version"],
+            health=arguments.get("health"),
         )
         return response.model_dump()
+    except StartupError as exc:
+        raise ValueError(exc.message)
 
-    if name == "metagate.health":
-        return {
-            "status": "healthy",
-            "service": "MetaGate",
-            "version": settings.metagate_version,
-            "instance_id": settings.instance_id,
-        }
 
+async def _handle_startup_failed(db, auth: AuthenticatedPrincipal, arguments: dict[str, Any]) -> dict[str, Any]:
+    try:
+        response = await mark_startup_failed(
+            db=db,
+            startup_id=_parse_uuid(arguments["startup_id"], "startup_id"),
+            error=arguments["error"],
+            details=arguments.get("details"),
+        )
+        return response.model_dump()
+    except StartupError as exc:
+        raise ValueError(exc.message)
+
+
+ToolHandler = Callable[[Any, AuthenticatedPrincipal, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+# Tools answered without authentication or a database session.
+_PUBLIC_TOOL_RESULTS: dict[str, dict[str, Any]] = {
+    "metagate.discovery": _DISCOVERY_RESULT,
+    "metagate.health": _HEALTH_RESULT,
+}
+_TOOL_HANDLERS: dict[str, ToolHandler] = {
+    "metagate.bootstrap": _handle_bootstrap,
+    "metagate.startup_ready": _handle_startup_ready,
+    "metagate.startup_failed": _handle_startup_failed,
+}
+_ADMIN_TOOL_HANDLERS: dict[str, ToolHandler] = {
+    "metagate.admin_principals": _handle_admin_principals,
+    "metagate.admin_profiles": _handle_admin_profiles,
+    "metagate.admin_manifests": _handle_admin_manifests,
+    "metagate.admin_bindings": _handle_admin_bindings,
+    "metagate.admin_secret_refs": _handle_admin_secret_refs,
+    "metagate.admin_onboard": _handle_admin_onboard,
+}
+
+
+async def _handle_tool(name: str, arguments: dict[str, Any], request: Request) -> dict[str, Any]:
+    public_result = _PUBLIC_TOOL_RESULTS.get(name)
+    if public_result is not None:
+        return public_result
+
+    # Reject unknown tools and anonymous calls before a pooled connection is checked out.
+    handler = _TOOL_HANDLERS.get(name)
+    requires_admin = handler is None
+    if requires_admin:
+        handler = _ADMIN_TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
     auth_token = _extract_auth_token(arguments, request)
+    if not auth_token:
+        raise ValueError("Missing auth token")
     async with AsyncSessionLocal() as db:
         auth = await _authenticate(db, auth_token)
+        if requires_admin and not auth.is_admin:
+            raise ValueError("Admin privileges required")
+        return await handler(db, auth, arguments)
 
-        if name == "metagate.bootstrap":
-            request_model = BootstrapRequest(**arguments)
-            try:
-                packet, is_cached = await perform_bootstrap(
-                    db=db,
-                    principal=auth.principal,
-                    component_key=request_model.component_key,
-                    principal_key_hint=request_model.principal_key,
-                    last_packet_etag=request_model.last_packet_etag,
-                )
-            except ForbiddenKeyError as exc:
-                raise ValueError(exc.message)
-            except BootstrapError as exc:
-                raise ValueError(exc.message)
-
-            if is_cached:
-                return {"not_modified": True}
-            return {"packet": packet.model_dump(), "packet_etag": packet.packet_etag}
-
-        if name == "metagate.startup_ready":
-            try:
-                response = await mark_startup_ready(
-                    db=db,
-                    startup_id=UUID(arguments["startup_id"]),
-                    build_version=arguments["build_version"],
-                    health=arguments.get("health"),
-                )
-                return response.model_dump()
-            except StartupError as exc:
-                raise ValueError(exc.message)
-
-        if name == "metagate.startup_failed":
-            try:
-                response = await mark_startup_failed(
-                    db=db,
-                    startup_id=UUID(arguments["startup_id"]),
-                    error=arguments["error"],
-                    details=arguments.get("details"),
-                )
-                return response.model_dump()
-            except StartupError as exc:
-                raise ValueError(exc.message)
-
-        if name.startswith("metagate.admin_"):
-            if not auth.principal or not is_admin_principal(auth.principal):
-                raise ValueError("Admin privileges required")
-
-            if name == "metagate.admin_principals":
-                return await _handle_admin_principals(db, auth, arguments)
-            if name == "metagate.admin_profiles":
-                return await _handle_admin_profiles(db, auth, arguments)
-            if name == "metagate.admin_manifests":
-                return await _handle_admin_manifests(db, auth, arguments)
-            if name == "metagate.admin_bindings":
-                return await _handle_admin_bindings(db, auth, arguments)
-            if name == "metagate.admin_secret_refs":
-                return await _handle_admin_secret_refs(db, auth, arguments)
-
-    raise ValueError(f"Unknown tool: {name}")
-
-
-@router.post("")
-async def mcp_entry(request_body: MCPRequest, request: Request):
-    await _rate_limit(request)
+
+@router.post("", response_class=ORJSONResponse)
+async def mcp_entry(request: Request) -> Response:
+    # Parse the raw body ourselves so prebuilt answers skip envelope validation entirely.
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return ORJSONResponse(_jsonrpc_error(None, -32700, "Parse error"))
+    if not isinstance(payload, dict):
+        return ORJSONResponse(_jsonrpc_error(None, -32600, "Invalid Request"))
+
+    static_result = _static_result(payload)
+    if static_result is not None:
+        return _jsonrpc_result_response(payload.get("id"), static_result)
+
+    request_body = MCPRequest.from_payload(payload)
+    if request_body is None:
+        return ORJSONResponse(_jsonrpc_error(payload.get("id"), -32600, "Invalid Request"))
+    limited = await request.app.state.rate_limiter.check_request(request)
+    if limited is not None:
+        return limited
+    return ORJSONResponse(await _dispatch(request_body, request))
+
+
+async def _dispatch(request_body: MCPRequest, request: Request) -> dict[str, Any]:
 
     if request_body.method == "tools/list":
         return _jsonrpc_result(request_body.id, {"tools": MCP_TOOLS})
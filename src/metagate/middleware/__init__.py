@@ -1,3 +1,3 @@
 """Middleware components."""
-from .rate_limit import RateLimiter, get_rate_limiter
-__all__ = ["RateLimiter", "get_rate_limiter"]
+from .rate_limit import RateLimiter
+__all__ = ["RateLimiter"]
@@ -1,72 +1,171 @@
 """Rate limiting middleware for MetaGate API."""
 
-import asyncio
 import logging
 import time
-from collections import defaultdict
-from typing import Dict, Tuple
+from array import array
+from typing import Dict, Optional, Tuple
 
-from fastapi import HTTPException, Request, status
+import orjson
+from fastapi import Request, Response, status
 
 logger = logging.getLogger(__name__)
 
 
+class _Window:
+    """Per-key call counts in one-second buckets covering the window."""
+
+    __slots__ = ("buckets", "last_sec", "total")
+
+    def __init__(self, window_seconds: int, now_sec: int):
+        self.buckets = array("I", [0]) * window_seconds
+        self.last_sec = now_sec
+        self.total = 0
+
+
 class InMemoryRateLimiter:
-    """In-memory rate limiter using sliding window."""
+    """In-memory rate limiter using a sliding window of per-second counters.
+
+    Each key keeps one counter per second of the window, so memory is fixed per key
+    and a request touches only the buckets that went stale since the key was last
+    seen. The check never awaits, so it runs atomically on the event loop and needs
+    no lock. Windows run on the monotonic clock in whole seconds, so wall-clock jumps
+    cannot reopen or extend them; only the reported reset time is wall-clock.
+    """
 
     def __init__(self):
-        self._windows: Dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self._windows: Dict[str, _Window] = {}
 
     async def check_rate_limit(
         self, key: str, max_calls: int, window_seconds: int
     ) -> Tuple[bool, int, int]:
-        """Check rate limit using sliding window."""
-        async with self._lock:
-            now = time.time()
-            window_start = now - window_seconds
-            self._windows[key] = [ts for ts in self._windows[key] if ts > window_start]
-            current_calls = len(self._windows[key])
-            allowed = current_calls < max_calls
-            remaining = max(0, max_calls - current_calls - (1 if allowed else 0))
-            reset_time = int(self._windows[key][0] + window_seconds) if self._windows[key] else int(now + window_seconds)
-            if allowed:
-                self._windows[key].append(now)
-            return allowed, remaining, reset_time
+        """Check rate limit using sliding window.
+
+        Returns whether the call is allowed, the calls remaining, and the Unix time at
+        which the limit next resets.
+        """
+        now_sec = int(time.monotonic())
+        windows = self._windows
+        window = windows.get(key)
+        if window is None or len(window.buckets) != window_seconds:
+            window = windows[key] = _Window(window_seconds, now_sec)
+        buckets = window.buckets
+        if now_sec - window.last_sec >= window_seconds:
+            if window.total:
+                window.buckets = buckets = array("I", [0]) * window_seconds
+                window.total = 0
+        else:
+            # Clear the buckets for seconds that have left the window since last use
+            for sec in range(window.last_sec + 1, now_sec + 1):
+                index = sec % window_seconds
+                window.total -= buckets[index]
+                buckets[index] = 0
+        window.last_sec = now_sec
+
+        current_calls = window.total
+        allowed = current_calls < max_calls
+        remaining = max(0, max_calls - current_calls - (1 if allowed else 0))
+        if allowed:
+            buckets[now_sec % window_seconds] += 1
+            window.total += 1
+            reset_sec = now_sec + window_seconds
+        else:
+            reset_sec = self._oldest_second(window, now_sec, window_seconds) + window_seconds
+        return allowed, remaining, int(time.time()) + reset_sec - now_sec
+
+    @staticmethod
+    def _oldest_second(window: _Window, now_sec: int, window_seconds: int) -> int:
+        """Return the second of the oldest call still counted in the window."""
+        for sec in range(now_sec - window_seconds + 1, now_sec + 1):
+            if window.buckets[sec % window_seconds]:
+                return sec
+        return now_sec
+
+
+# The 429 body never varies; only the timing headers are filled in per response.
+_RATE_LIMITED_BODY = orjson.dumps({"detail": "Rate limit exceeded"})
+
+
+class _FloodSketch:
+    """Count-min sketch of requests per client over short fixed epochs.
+
+    Two counter rows are indexed by independently salted hashes of the client key; the
+    smaller of the two counts never underestimates a client's traffic. Counters are
+    zeroed lazily when a new epoch starts, so no background task is needed.
+    """
+
+    __slots__ = ("rows", "salts", "epoch", "epoch_seconds")
+
+    WIDTH = 4096
+    _MASK = WIDTH - 1
+
+    def __init__(self, epoch_seconds: int = 10):
+        self.rows = (array("I", [0]) * self.WIDTH, array("I", [0]) * self.WIDTH)
+        self.salts = (0x9E3779B1, 0x85EBCA77)
+        self.epoch = -1
+        self.epoch_seconds = epoch_seconds
+
+    def add(self, key: str, now_sec: int) -> int:
+        """Count one request for key and return its estimated count this epoch."""
+        epoch = now_sec // self.epoch_seconds
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self.rows = (array("I", [0]) * self.WIDTH, array("I", [0]) * self.WIDTH)
+        first, second = self.rows
+        i = hash((self.salts[0], key)) & self._MASK
+        j = hash((self.salts[1], key)) & self._MASK
+        first[i] += 1
+        second[j] += 1
+        return min(first[i], second[j])
+
+    def seconds_left(self, now_sec: int) -> int:
+        return self.epoch_seconds - now_sec % self.epoch_seconds
 
 
 class RateLimiter:
-    """Main rate limiter."""
+    """Main rate limiter.
+
+    A flood sketch sits in front of the sliding-window backend. Clients sending more
+    than twice the per-minute budget within one sketch epoch are rejected without a
+    backend lookup; they would be rejected by the window anyway.
+    """
 
     def __init__(self, calls_per_minute: int = 100, enabled: bool = True):
         self.backend = InMemoryRateLimiter()
         self.calls_per_minute = calls_per_minute
         self.enabled = enabled
+        self._limit_header = str(calls_per_minute)
+        self._sketch = _FloodSketch()
+        self._flood_threshold = 2 * calls_per_minute
 
-    async def check_request(self, request: Request) -> None:
-        """Check if request should be rate limited."""
+    async def check_request(self, request: Request) -> Optional[Response]:
+        """Return a 429 response if the request is over its limit, otherwise None.
+
+        The response is returned rather than raised so rejected requests, the bulk of
+        traffic under abuse, skip FastAPI's exception handling.
+        """
         if not self.enabled:
-            return
+            return None
         client_ip = request.client.host if request.client else "unknown"
         key = f"ip:{client_ip}"
+        now_sec = int(time.monotonic())
+        if self._sketch.add(key, now_sec) > self._flood_threshold:
+            retry_after = self._sketch.seconds_left(now_sec)
+            return self._limited(retry_after, int(time.time()) + retry_after)
         allowed, remaining, reset_time = await self.backend.check_rate_limit(key, self.calls_per_minute, 60)
-        if not allowed:
-            retry_after = reset_time - int(time.time())
-            logger.warning(f"Rate limit exceeded for {key}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Retry after {retry_after} seconds.",
-                headers={"Retry-After": str(retry_after), "X-RateLimit-Limit": str(self.calls_per_minute), 
-                        "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_time)},
-            )
-
-
-_rate_limiter = None
-
-
-def get_rate_limiter(calls_per_minute: int, enabled: bool) -> RateLimiter:
-    """Get rate limiter singleton."""
-    global _rate_limiter
-    if _rate_limiter is None:
-        _rate_limiter = RateLimiter(calls_per_minute, enabled)
-    return _rate_limiter
+        if allowed:
+            return None
+        logger.warning("Rate limit exceeded for %s", key)
+        return self._limited(reset_time - int(time.time()), reset_time)
+
+    def _limited(self, retry_after: int, reset_time: int) -> Response:
+        return Response(
+            content=_RATE_LIMITED_BODY,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            media_type="application/json",
+            headers={
+                "Retry-After": str(retry_after),
+                "X-RateLimit-Limit": self._limit_header,
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset_time),
+            },
+        )
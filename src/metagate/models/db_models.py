@@ -1,16 +1,31 @@
 """SQLAlchemy ORM models."""
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, DateTime, Text, Enum, JSON, Uuid
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, DateTime, Text, Enum, Index, JSON, LargeBinary, TypeDecorator, Uuid
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy.sql import func, text
 import enum
 
 from ..database import Base
+from ..ids import uuid7
 
 JSONType = JSON().with_variant(JSONB, "postgresql")
 
 
+class HexBytes(TypeDecorator):
+    """Hex digest stored as raw bytes (BYTEA on PostgreSQL), half the size of the text.
+
+    Values are hex strings on the Python side, so callers never see the binary form.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else value.hex()
+
+
 class AuditAction(enum.Enum):
     """Audit action types for tracking operations."""
     CREATE = "CREATE"
@@ -23,11 +38,20 @@ class AuditAction(enum.Enum):
 class Principal(Base):
     """Principal - who is speaking."""
     __tablename__ = "principals"
-
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Covers the JWT principal lookup so it can be answered from the index alone
+        Index(
+            "idx_principals_auth_subject_cov",
+            "auth_subject",
+            unique=True,
+            postgresql_include=["id", "tenant_key", "principal_key", "principal_type", "status"],
+        ),
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     principal_key = Column(Text, unique=True, nullable=False)
-    auth_subject = Column(Text, unique=True, nullable=False)
+    auth_subject = Column(Text, nullable=False)
     principal_type = Column(Text, nullable=False)
     status = Column(Text, nullable=False, default="active")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -43,7 +67,7 @@ class Profile(Base):
     """Profile - capabilities and policy constraints."""
     __tablename__ = "profiles"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     profile_key = Column(Text, unique=True, nullable=False)
     capabilities = Column(JSONType, nullable=False)
@@ -61,7 +85,7 @@ class Manifest(Base):
     """Manifest - world description."""
     __tablename__ = "manifests"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     manifest_key = Column(Text, unique=True, nullable=False)
     deployment_key = Column(Text, default="default")
@@ -82,8 +106,18 @@ class Manifest(Base):
 class Binding(Base):
     """Binding - ties principal to profile and manifest."""
     __tablename__ = "bindings"
-
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # At most one active binding per principal; also serves the bootstrap lookup
+        Index(
+            "idx_bindings_principal_active",
+            "principal_id",
+            unique=True,
+            postgresql_where=text("active = true"),
+            sqlite_where=text("active = true"),
+        ),
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     principal_id = Column(Uuid(as_uuid=True), ForeignKey("principals.id", ondelete="CASCADE"))
     profile_id = Column(Uuid(as_uuid=True), ForeignKey("profiles.id", ondelete="CASCADE"))
@@ -104,7 +138,7 @@ class SecretRef(Base):
     """Secret reference - references only, never stores values."""
     __tablename__ = "secret_refs"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     secret_key = Column(Text, unique=True, nullable=False)
     ref_kind = Column(Text, default="env")
@@ -120,15 +154,15 @@ class StartupSession(Base):
     """Startup session - bootstrap witness record."""
     __tablename__ = "startup_sessions"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     deployment_key = Column(Text, default="default")
     subject_principal_key = Column(Text, nullable=False)
     component_key = Column(Text, nullable=False)
     profile_key = Column(Text, nullable=False)
     manifest_key = Column(Text, nullable=False)
-    packet_etag = Column(Text, nullable=False)
-    packet_hash_redacted = Column(Text, nullable=False)
+    packet_etag = Column(HexBytes, nullable=False)
+    packet_hash_redacted = Column(HexBytes, nullable=False)
     status = Column(Text, nullable=False)
     opened_at = Column(DateTime(timezone=True), nullable=False)
     deadline_at = Column(DateTime(timezone=True))
@@ -145,9 +179,10 @@ class ApiKey(Base):
     """API Key for authentication."""
     __tablename__ = "api_keys"
 
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default")
     key_hash = Column(Text, unique=True, nullable=False)
+    key_lookup = Column(Text, unique=True, nullable=True)
     principal_id = Column(Uuid(as_uuid=True), ForeignKey("principals.id", ondelete="CASCADE"))
     name = Column(Text, nullable=False)
     status = Column(Text, default="active")
@@ -164,12 +199,31 @@ class AuditLog(Base):
 
     Records who did what, when, and on which resource. This provides
     an immutable accountability trail for security-sensitive changes.
+
+    On PostgreSQL the table is range-partitioned by month on ``timestamp``
+    (migration 006), which is why ``timestamp`` is part of the primary key.
     """
     __tablename__ = "audit_log"
-
-    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Containment (@>) searches on the JSONB payloads; migration 007
+        Index(
+            "idx_audit_log_changes_gin",
+            "changes",
+            postgresql_using="gin",
+            postgresql_ops={"changes": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_audit_log_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid7)
     tenant_key = Column(Text, default="default", nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
     action = Column(Text, nullable=False)
     resource_type = Column(Text, nullable=False)
     resource_id = Column(Uuid(as_uuid=True), nullable=False)
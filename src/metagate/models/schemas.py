@@ -218,3 +218,23 @@ class SecretRefResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class OnboardCreate(BaseModel):
+    """Create a principal, profile, manifest and their binding in one transaction.
+
+    All rows are created in ``tenant_key``; tenant keys on the nested payloads are ignored.
+    """
+    principal: PrincipalCreate
+    profile: ProfileCreate
+    manifest: ManifestCreate
+    overrides: Optional[dict[str, Any]] = None
+    tenant_key: Optional[str] = "default"
+
+
+class OnboardResponse(BaseModel):
+    """Rows created by an onboarding request."""
+    principal: PrincipalResponse
+    profile: ProfileResponse
+    manifest: ManifestResponse
+    binding: BindingResponse
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 import httpx
+import orjson
 
 from .config import get_settings
 from .logging import get_logger
@@ -12,6 +13,28 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# One pooled client per process keeps connections (and their TLS sessions) to
+# ReceiptGate alive across receipts; it is closed in the app's lifespan shutdown.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the pooled ReceiptGate client, if one was opened."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _normalize_endpoint(endpoint: str) -> str:
     endpoint = (endpoint or "").rstrip("/")
@@ -44,14 +67,13 @@ async def emit_receipt(payload: dict[str, Any]) -> bool:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(endpoint, json=request_payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            if "error" in data:
-                logger.warning("receiptgate_emit_failed", error=str(data["error"]))
-                return False
-            return True
+        response = await _get_client().post(endpoint, content=orjson.dumps(request_payload), headers=headers)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        if "error" in data:
+            logger.warning("receiptgate_emit_failed", error=str(data["error"]))
+            return False
+        return True
     except Exception as exc:
         logger.warning("receiptgate_emit_failed", error=str(exc))
         return False
@@ -0,0 +1,16 @@
+"""Response classes shared across MetaGate routes."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson serializes UUIDs and datetimes natively, so handlers can return
+    ``model_dump()`` output directly without a ``jsonable_encoder`` pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
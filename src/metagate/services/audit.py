@@ -8,14 +8,74 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import Request
+from sqlalchemy import insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..ids import uuid7
 from ..models.db_models import AuditLog, AuditAction
 from ..logging import get_logger
 
 logger = get_logger("metagate.audit")
 
 
+class AuditBuffer:
+    """Collects audit entries for a bulk operation and writes them in one INSERT.
+
+    ``record_audit`` adds one mapped row per call, which costs a round trip per entry.
+    Bulk admin flows such as ``metagate.admin_onboard`` add their entries here instead
+    and call ``flush`` inside the same transaction as the changes being audited.
+    """
+
+    def __init__(self):
+        self.rows: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(
+        self,
+        *,
+        action: str | AuditAction,
+        resource_type: str,
+        resource_id: UUID,
+        actor_principal_key: str,
+        tenant_key: str = "default",
+        resource_key: str | None = None,
+        actor_ip: str | None = None,
+        actor_user_agent: str | None = None,
+        changes: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue an audit entry; arguments match ``record_audit``."""
+        if isinstance(action, AuditAction):
+            action = action.value
+        self.rows.append({
+            "id": uuid7(),
+            "tenant_key": tenant_key,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "resource_key": resource_key,
+            "actor_principal_key": actor_principal_key,
+            "actor_ip": actor_ip,
+            "actor_user_agent": actor_user_agent,
+            "changes": changes,
+            "metadata_": metadata,
+        })
+
+    async def flush(self, db: AsyncSession) -> int:
+        """Insert the queued entries without committing and return how many were written.
+
+        The rows go out as a multi-row INSERT (SQLAlchemy's insertmanyvalues), so a
+        bulk operation costs one statement per page of entries rather than one per entry.
+        """
+        rows, self.rows = self.rows, []
+        if rows:
+            await db.execute(insert(AuditLog), rows)
+            logger.info("audit_recorded_batch", count=len(rows))
+        return len(rows)
+
+
 async def record_audit(
     db: AsyncSession,
     *,
@@ -79,6 +139,21 @@ async def record_audit(
     return audit_entry
 
 
+async def ensure_audit_partitions(db: AsyncSession) -> None:
+    """Make sure the current and next month's audit_log partitions exist.
+
+    Partitions are created by the ``ensure_audit_log_partition`` function from
+    migration 006; other databases keep audit_log unpartitioned and skip this.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    await db.execute(text(
+        "SELECT ensure_audit_log_partition(CURRENT_DATE),"
+        " ensure_audit_log_partition((CURRENT_DATE + INTERVAL '1 month')::DATE)"
+    ))
+    await db.commit()
+
+
 def extract_request_info(request: Request | None) -> tuple[str | None, str | None]:
     """Extract IP and user agent from a request.
 
@@ -1,24 +1,36 @@
 """Bootstrap service - core logic for bootstrap and welcome packet generation."""
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
+from sqlalchemy.orm import raiseload
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 import hashlib
 import json
+import re
 from typing import Optional, Any
 
+import orjson
+
 from ..models.db_models import Principal, Binding, Profile, Manifest, StartupSession, SecretRef
 from ..models.schemas import WelcomePacket, StartupBlock
 from ..config import get_settings
+from ..ids import uuid7
 from ..services.receipts import emit_startup_receipt
 
 settings = get_settings()
 
 # Forbidden keys per spec section 9
-FORBIDDEN_KEYS = {
+FORBIDDEN_KEYS = frozenset({
     "tasks", "jobs", "work_items", "payloads",
     "deploy", "scale", "provision", "execute"
-}
+})
+
+# Matches any forbidden key as a JSON object key in serialized data, so clean
+# payloads are rejected in a single regex pass without walking the structure.
+_FORBIDDEN_KEY_PATTERN = re.compile(
+    r'"(?:' + "|".join(sorted(map(re.escape, FORBIDDEN_KEYS))) + r')"\s*:',
+    re.IGNORECASE,
+)
 
 
 class BootstrapError(Exception):
@@ -43,20 +55,41 @@ class ForbiddenKeyError(BootstrapError):
 
 
 def check_forbidden_keys(data: dict[str, Any], path: str = "") -> set[str]:
-    """Recursively check for forbidden keys in a dict."""
+    """Check for forbidden keys in a dict, returning their dotted paths."""
+    serialized = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    if not _FORBIDDEN_KEY_PATTERN.search(serialized):
+        return set()
+    return _find_forbidden_keys(data, path)
+
+
+def _find_forbidden_keys(data: dict[str, Any], path: str) -> set[str]:
+    """Collect the paths of forbidden keys in nested dicts and lists."""
     found = set()
-    for key, value in data.items():
-        if key.lower() in FORBIDDEN_KEYS:
-            found.add(f"{path}.{key}" if path else key)
-        if isinstance(value, dict):
-            found.update(check_forbidden_keys(value, f"{path}.{key}" if path else key))
+    stack: list[tuple[str, Any]] = [(path, data)]
+    while stack:
+        prefix, node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                key_path = f"{prefix}.{key}" if prefix else key
+                if key.lower() in FORBIDDEN_KEYS:
+                    found.add(key_path)
+                if isinstance(value, (dict, list)):
+                    stack.append((key_path, value))
+        else:
+            for index, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    stack.append((f"{prefix}[{index}]", item))
     return found
 
 
 def generate_etag(data: dict[str, Any]) -> str:
-    """Generate an ETag for the packet data."""
-    content = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.md5(content.encode()).hexdigest()
+    """Generate an ETag for the packet data.
+
+    The ETag only detects change, so it uses BLAKE2b over orjson's sorted-key encoding
+    rather than a pure-Python canonical dump; the redacted hash stays SHA-256.
+    """
+    content = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
 def generate_redacted_hash(data: dict[str, Any]) -> str:
@@ -76,17 +109,26 @@ def generate_redacted_hash(data: dict[str, Any]) -> str:
 async def get_active_binding(
     db: AsyncSession,
     principal: Principal
-) -> Optional[Binding]:
-    """Get the active binding for a principal."""
+) -> Optional[tuple[Binding, Optional[Profile], Optional[Manifest]]]:
+    """Get the active binding for a principal with its profile and manifest.
+
+    All three rows come back from one joined query. The joins are outer so a binding
+    whose profile or manifest is missing is still reported as such. Relationships are
+    set to raise on access, so a stray lazy load on the bootstrap path fails loudly
+    instead of adding a round trip.
+    """
     result = await db.execute(
-        select(Binding)
+        select(Binding, Profile, Manifest)
+        .outerjoin(Profile, Profile.id == Binding.profile_id)
+        .outerjoin(Manifest, Manifest.id == Binding.manifest_id)
         .where(
             Binding.principal_id == principal.id,
             Binding.active.is_(True)
         )
+        .options(raiseload("*"))
         .limit(1)
     )
-    return result.scalar_one_or_none()
+    return result.one_or_none()
 
 
 async def get_required_env_refs(
@@ -127,7 +169,7 @@ async def create_startup_session(
     deadline = now + timedelta(seconds=profile.startup_sla_seconds)
 
     session = StartupSession(
-        id=uuid4(),
+        id=uuid7(),
         tenant_key=principal.tenant_key,
         deployment_key=manifest.deployment_key,
         subject_principal_key=principal.principal_key,
@@ -144,26 +186,35 @@ async def create_startup_session(
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
 
     return session
 
 
 
-async def cleanup_old_sessions(db: AsyncSession, retention_hours: int) -> int:
+async def cleanup_old_sessions(
+    db: AsyncSession,
+    retention_hours: int,
+    batch_size: Optional[int] = None,
+) -> int:
     """
     Clean up old startup sessions past retention period.
 
     Only removes sessions that are in terminal states (READY/FAILED).
+    When batch_size is given, at most that many sessions are deleted so the
+    transaction stays short; callers repeat until fewer are returned.
     Returns the number of deleted sessions.
     """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
-    result = await db.execute(
-        delete(StartupSession).where(
-            StartupSession.created_at < cutoff,
-            StartupSession.status.in_(["READY", "FAILED"])
-        )
+    expired = (
+        StartupSession.created_at < cutoff,
+        StartupSession.status.in_(["READY", "FAILED"]),
     )
+    if batch_size is None:
+        stmt = delete(StartupSession).where(*expired)
+    else:
+        batch = select(StartupSession.id).where(*expired).limit(batch_size)
+        stmt = delete(StartupSession).where(StartupSession.id.in_(batch.scalar_subquery()))
+    result = await db.execute(stmt)
     await db.commit()
     return result.rowcount
 
@@ -189,18 +240,16 @@ async def perform_bootstrap(
             code="PRINCIPAL_MISMATCH"
         )
 
-    # Get active binding
-    binding = await get_active_binding(db, principal)
-    if not binding:
+    # Get active binding with its profile and manifest
+    bound = await get_active_binding(db, principal)
+    if not bound:
         raise BootstrapError(
             f"No active binding for principal {principal.principal_key}",
             status_code=403,
             code="NO_BINDING"
         )
+    binding, profile, manifest = bound
 
-    # Load profile and manifest
-    result = await db.execute(select(Profile).where(Profile.id == binding.profile_id))
-    profile = result.scalar_one_or_none()
     if not profile:
         raise BootstrapError("Profile not found", status_code=500, code="PROFILE_NOT_FOUND")
 
@@ -213,8 +262,6 @@ async def perform_bootstrap(
             code="COMPONENT_NOT_PERMITTED"
         )
 
-    result = await db.execute(select(Manifest).where(Manifest.id == binding.manifest_id))
-    manifest = result.scalar_one_or_none()
     if not manifest:
         raise BootstrapError("Manifest not found", status_code=500, code="MANIFEST_NOT_FOUND")
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import cache
 import json
 import sys
 from pathlib import Path
@@ -13,22 +14,27 @@ from ..models.db_models import StartupSession
 from ..receiptgate_client import emit_receipt
 from ..logging import get_logger
 
-try:
-    from legivellum.models import Receipt as CanonicalReceipt
-except ImportError:
-    CanonicalReceipt = None
+logger = get_logger(__name__)
+
+
+@cache
+def _canonical_receipt_model() -> type | None:
+    """Locate the LegiVellum Receipt model on first use rather than at import."""
+    try:
+        from legivellum.models import Receipt
+        return Receipt
+    except ImportError:
+        pass
     for parent in Path(__file__).resolve().parents:
         shared_root = parent / "LegiVellum" / "shared"
         if shared_root.exists():
             sys.path.append(str(shared_root))
             try:
-                from legivellum.models import Receipt as CanonicalReceipt
+                from legivellum.models import Receipt
+                return Receipt
             except ImportError:
-                CanonicalReceipt = None
-            break
-
-
-logger = get_logger(__name__)
+                return None
+    return None
 
 
 def _iso(dt: datetime | None) -> str | None:
@@ -134,11 +140,12 @@ def build_startup_receipt(
         },
     }
 
-    if CanonicalReceipt is None:
+    canonical_receipt = _canonical_receipt_model()
+    if canonical_receipt is None:
         return base
 
     try:
-        return CanonicalReceipt.model_validate(base).model_dump(mode="json")
+        return canonical_receipt.model_validate(base).model_dump(mode="json")
     except Exception as exc:
         logger.warning("startup_receipt_validation_failed", error=str(exc))
         return base
@@ -1,6 +1,5 @@
 """Startup session management service."""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from datetime import datetime, timezone
 from uuid import UUID
 from typing import Optional, Any
@@ -25,10 +24,7 @@ async def get_startup_session(
     startup_id: UUID
 ) -> Optional[StartupSession]:
     """Get a startup session by ID."""
-    result = await db.execute(
-        select(StartupSession).where(StartupSession.id == startup_id)
-    )
-    return result.scalar_one_or_none()
+    return await db.get(StartupSession, startup_id)
 
 
 async def mark_startup_ready(
@@ -65,7 +61,6 @@ async def mark_startup_ready(
     }
 
     await db.commit()
-    await db.refresh(session)
 
     await emit_startup_receipt(
         session=session,
@@ -116,7 +111,6 @@ async def mark_startup_failed(
     }
 
     await db.commit()
-    await db.refresh(session)
 
     await emit_startup_receipt(
         session=session,
@@ -3,20 +3,43 @@
 from metagate.auth.auth import AuthenticatedPrincipal
 from metagate.config import get_settings
 
+settings = get_settings()
+
+# Settings are fixed for the process lifetime, so resolve the flag once at import.
+_ALLOW_CROSS_TENANT: bool = bool(settings.admin_allow_cross_tenant)
+
 
 def resolve_tenant_key(auth: AuthenticatedPrincipal, requested: str | None) -> str:
     """Resolve tenant key with optional cross-tenant access."""
-    settings = get_settings()
-    if settings.admin_allow_cross_tenant:
-        return requested or auth.principal.tenant_key
-    if requested and requested != auth.principal.tenant_key:
+    tenant_key = auth.tenant_key
+    if tenant_key is None:
+        raise ValueError("Authenticated principal has no tenant")
+    if _ALLOW_CROSS_TENANT:
+        return requested or tenant_key
+    if requested and requested != tenant_key:
         raise ValueError("Cross-tenant admin access denied")
-    return auth.principal.tenant_key
+    return tenant_key
 
 
-def apply_tenant_scope(query, auth: AuthenticatedPrincipal, model):
-    """Apply tenant scoping to a query when cross-tenant access is disabled."""
-    settings = get_settings()
-    if settings.admin_allow_cross_tenant:
+# The scoping mode is chosen once at import so the per-query helper carries no branch.
+if _ALLOW_CROSS_TENANT:
+    def apply_tenant_scope(query, auth: AuthenticatedPrincipal, model):
+        """Return the query unchanged; cross-tenant admin access is enabled."""
         return query
-    return query.where(model.tenant_key == auth.principal.tenant_key)
+else:
+    def apply_tenant_scope(query, auth: AuthenticatedPrincipal, model):
+        """Restrict the query to the authenticated principal's tenant."""
+        return query.where(model.tenant_key == auth.tenant_key)
+
+
+async def get_in_tenant_scope(db, auth: AuthenticatedPrincipal, model, object_id):
+    """Load a row by primary key, hiding it when it belongs to another tenant.
+
+    Uses ``Session.get`` so repeated lookups within a session hit the identity map.
+    """
+    obj = await db.get(model, object_id)
+    if obj is None:
+        return None
+    if not _ALLOW_CROSS_TENANT and obj.tenant_key != auth.tenant_key:
+        return None
+    return obj
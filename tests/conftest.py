@@ -12,6 +12,7 @@ from sqlalchemy import StaticPool
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 os.environ.setdefault("METAGATE_JWT_SECRET", "test-secret")
+os.environ.setdefault("METAGATE_API_KEY_PEPPER", "test-pepper")
 os.environ.setdefault("METAGATE_DEBUG", "true")
 os.environ.setdefault("METAGATE_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
@@ -19,7 +20,7 @@ from metagate.database import Base
 from metagate.main import app
 from metagate.database import get_db
 from metagate.models.db_models import Principal, Profile, Manifest, Binding, ApiKey
-from metagate.auth.auth import hash_api_key
+from metagate.auth.auth import _reset_legacy_scan, api_key_cache, auth_cache, hash_api_key, jwt_cache
 
 
 # Use in-memory SQLite for testing
@@ -34,6 +35,19 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Reset in-process credential caches so tests do not leak auth results."""
+    api_key_cache.clear()
+    auth_cache.clear()
+    jwt_cache.clear()
+    _reset_legacy_scan()
+    yield
+    api_key_cache.clear()
+    auth_cache.clear()
+    jwt_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def test_engine():
     """Create test database engine."""
@@ -209,3 +223,30 @@ async def test_api_key(
     await test_session.commit()
     await test_session.refresh(api_key)
     return raw_key, api_key
+
+
+@pytest_asyncio.fixture
+async def admin_api_key(test_session: AsyncSession) -> str:
+    """Create an admin principal with an API key and return the raw key."""
+    admin = Principal(
+        id=uuid4(),
+        tenant_key="default",
+        principal_key="test-admin-001",
+        auth_subject="test-admin-subject-001",
+        principal_type="admin",
+        status="active",
+    )
+    test_session.add(admin)
+    raw_key = "test_admin_key_12345"
+    test_session.add(
+        ApiKey(
+            id=uuid4(),
+            tenant_key="default",
+            key_hash=hash_api_key(raw_key),
+            principal_id=admin.id,
+            name="Test Admin Key",
+            status="active",
+        )
+    )
+    await test_session.commit()
+    return raw_key
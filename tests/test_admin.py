@@ -1,6 +1,31 @@
 """Tests for admin API endpoints."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import jwt
 import pytest
 
+from metagate.config import get_settings
+
+from sqlalchemy import select
+
+from metagate.models.db_models import AuditLog, Principal
+
+
+async def call_tool(client, name, arguments, request_id=1):
+    """Invoke an MCP tool and return the decoded JSON-RPC response."""
+    response = await client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        },
+    )
+    assert response.status_code == 200
+    return response.json()
+
 
 class TestAdminEndpoints:
     """Tests for admin CRUD operations."""
@@ -56,6 +81,360 @@ class TestAdminEndpoints:
         assert "metagate_version" in data
         assert "bootstrap_endpoint" in data
 
+    @pytest.mark.asyncio
+    async def test_tools_list_echoes_request_id(self, client):
+        """Prebuilt tools/list responses should carry the caller's request id."""
+        response = await client.post(
+            "/mcp", json={"jsonrpc": "2.0", "id": "abc", "method": "tools/list"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["id"] == "abc"
+        assert "metagate.bootstrap" in {tool["name"] for tool in data["result"]["tools"]}
+
+    @pytest.mark.asyncio
+    async def test_malformed_json_returns_parse_error(self, client):
+        """Should answer unparseable bodies with a JSON-RPC parse error."""
+        response = await client.post(
+            "/mcp", content=b"{not json", headers={"content-type": "application/json"}
+        )
+        assert response.status_code == 200
+        assert response.json()["error"]["code"] == -32700
+
+    @pytest.mark.asyncio
+    async def test_invalid_envelope_returns_invalid_request(self, client):
+        """Should reject envelopes without a method as invalid requests."""
+        response = await client.post("/mcp", json={"jsonrpc": "2.0", "id": 7})
+        data = response.json()
+        assert data["id"] == 7
+        assert data["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_rejected_before_auth(self, client):
+        """Should report an unknown tool without requiring authentication."""
+        data = await call_tool(client, "metagate.nonexistent", {})
+        assert data["error"]["message"] == "Unknown tool: metagate.nonexistent"
+
+
+class TestAdminBindings:
+    """Tests for binding management via admin tools."""
+
+    @pytest.mark.asyncio
+    async def test_create_binding(
+        self, client, admin_api_key, test_principal, test_profile, test_manifest
+    ):
+        """Should create a binding when all referenced entities exist."""
+        data = await call_tool(
+            client,
+            "metagate.admin_bindings",
+            {
+                "auth_token": admin_api_key,
+                "action": "create",
+                "data": {
+                    "principal_id": str(test_principal.id),
+                    "profile_id": str(test_profile.id),
+                    "manifest_id": str(test_manifest.id),
+                },
+            },
+        )
+        assert "error" not in data
+        assert data["result"]["principal_id"] == str(test_principal.id)
+        assert data["result"]["active"] is True
+
+    @pytest.mark.asyncio
+    async def test_create_active_binding_deactivates_previous(
+        self, client, admin_api_key, test_session, test_binding
+    ):
+        """Should leave only the newly created binding active for the principal."""
+        data = await call_tool(
+            client,
+            "metagate.admin_bindings",
+            {
+                "auth_token": admin_api_key,
+                "action": "create",
+                "data": {
+                    "principal_id": str(test_binding.principal_id),
+                    "profile_id": str(test_binding.profile_id),
+                    "manifest_id": str(test_binding.manifest_id),
+                },
+            },
+        )
+        assert data["result"]["active"] is True
+
+        await test_session.refresh(test_binding)
+        assert test_binding.active is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("missing", ["Principal", "Profile", "Manifest"])
+    async def test_create_binding_rejects_missing_target(
+        self, client, admin_api_key, test_principal, test_profile, test_manifest, missing
+    ):
+        """Should reject a binding that references a non-existent entity."""
+        ids = {
+            "principal_id": str(test_principal.id),
+            "profile_id": str(test_profile.id),
+            "manifest_id": str(test_manifest.id),
+        }
+        ids[f"{missing.lower()}_id"] = str(uuid4())
+        data = await call_tool(
+            client,
+            "metagate.admin_bindings",
+            {"auth_token": admin_api_key, "action": "create", "data": ids},
+        )
+        assert data["error"]["message"] == f"{missing} not found"
+
+
+class TestAdminOnboard:
+    """Tests for the single-transaction onboarding tool."""
+
+    @pytest.mark.asyncio
+    async def test_onboard_creates_bound_rows(self, client, admin_api_key):
+        """Should create all four rows and bind them together."""
+        data = await call_tool(
+            client,
+            "metagate.admin_onboard",
+            {
+                "auth_token": admin_api_key,
+                "principal": {
+                    "principal_key": "onboard-001",
+                    "auth_subject": "onboard-subject-001",
+                    "principal_type": "component",
+                },
+                "profile": {"profile_key": "onboard-profile", "capabilities": {}, "policy": {}},
+                "manifest": {
+                    "manifest_key": "onboard-manifest",
+                    "environment": {},
+                    "services": {},
+                    "memory_map": {},
+                    "polling": {},
+                    "schemas": {},
+                },
+            },
+        )
+        result = data["result"]
+        binding = result["binding"]
+        assert binding["principal_id"] == result["principal"]["id"]
+        assert binding["profile_id"] == result["profile"]["id"]
+        assert binding["manifest_id"] == result["manifest"]["id"]
+        assert binding["active"] is True
+
+    @pytest.mark.asyncio
+    async def test_onboard_records_audit_entries(self, client, admin_api_key, test_session):
+        """Should record a CREATE audit entry for each of the four rows."""
+        data = await call_tool(
+            client,
+            "metagate.admin_onboard",
+            {
+                "auth_token": admin_api_key,
+                "principal": {
+                    "principal_key": "onboard-002",
+                    "auth_subject": "onboard-subject-002",
+                    "principal_type": "component",
+                },
+                "profile": {"profile_key": "onboard-profile-2", "capabilities": {}, "policy": {}},
+                "manifest": {
+                    "manifest_key": "onboard-manifest-2",
+                    "environment": {},
+                    "services": {},
+                    "memory_map": {},
+                    "polling": {},
+                    "schemas": {},
+                },
+            },
+        )
+        result = data["result"]
+
+        entries = (await test_session.execute(select(AuditLog))).scalars().all()
+        assert {entry.resource_type: str(entry.resource_id) for entry in entries} == {
+            name: result[name]["id"] for name in ("principal", "profile", "manifest", "binding")
+        }
+        assert all(entry.action == "CREATE" for entry in entries)
+        assert {entry.actor_principal_key for entry in entries} == {"test-admin-001"}
+
+
+class TestAdminGet:
+    """Tests for tenant-scoped primary key lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_principal_by_id(self, client, admin_api_key, test_principal):
+        """Should return a principal in the caller's tenant."""
+        data = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": admin_api_key, "action": "get", "principal_id": str(test_principal.id)},
+        )
+        assert data["result"]["principal_key"] == test_principal.principal_key
+
+    @pytest.mark.asyncio
+    async def test_get_hides_other_tenant_rows(self, client, admin_api_key, test_session):
+        """Should report rows from another tenant as not found."""
+        other = Principal(
+            id=uuid4(),
+            tenant_key="other-tenant",
+            principal_key="other-principal",
+            auth_subject="other-subject",
+            principal_type="component",
+            status="active",
+        )
+        test_session.add(other)
+        await test_session.commit()
+
+        data = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": admin_api_key, "action": "get", "principal_id": str(other.id)},
+        )
+        assert data["error"]["message"] == "Principal not found"
+
+    @pytest.mark.asyncio
+    async def test_jwt_admin_gets_own_principal(self, client, test_session):
+        """Should return the caller's own principal in full when authenticated by JWT."""
+        admin = Principal(
+            id=uuid4(),
+            tenant_key="default",
+            principal_key="jwt-admin-001",
+            auth_subject="jwt-admin-subject-001",
+            principal_type="admin",
+            status="active",
+        )
+        test_session.add(admin)
+        await test_session.commit()
+        settings = get_settings()
+        now = datetime.now(timezone.utc)
+        token = jwt.encode(
+            {"sub": admin.auth_subject, "iat": now, "exp": now + timedelta(minutes=5)},
+            settings.jwt_secret,
+            algorithm=settings.jwt_algorithm,
+        )
+
+        data = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": token, "action": "get", "principal_id": str(admin.id)},
+        )
+        assert "error" not in data
+        assert data["result"]["principal_key"] == "jwt-admin-001"
+        assert data["result"]["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_rejects_malformed_id(self, client, admin_api_key):
+        """Should name the argument when an id is not a UUID."""
+        data = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": admin_api_key, "action": "get", "principal_id": "not-a-uuid"},
+        )
+        assert data["error"]["message"] == "principal_id must be a valid UUID"
+
+    @pytest.mark.asyncio
+    async def test_get_accepts_bearer_header(self, client, admin_api_key, test_principal):
+        """Should read the token from a case-insensitive bearer header."""
+        response = await client.post(
+            "/mcp",
+            headers={"Authorization": f"BEARER {admin_api_key}"},
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {
+                    "name": "metagate.admin_principals",
+                    "arguments": {"action": "get", "principal_id": str(test_principal.id)},
+                },
+            },
+        )
+        assert response.json()["result"]["principal_key"] == test_principal.principal_key
+
+
+class TestAdminDelete:
+    """Tests for tenant-scoped deletes."""
+
+    @pytest.mark.asyncio
+    async def test_delete_secret_ref(self, client, admin_api_key):
+        """Should delete a secret ref and report it missing afterwards."""
+        created = await call_tool(
+            client,
+            "metagate.admin_secret_refs",
+            {
+                "auth_token": admin_api_key,
+                "action": "create",
+                "data": {"secret_key": "db-password", "ref_name": "DB_PASSWORD"},
+            },
+        )
+        secret_ref_id = created["result"]["id"]
+
+        arguments = {"auth_token": admin_api_key, "action": "delete", "secret_ref_id": secret_ref_id}
+        deleted = await call_tool(client, "metagate.admin_secret_refs", arguments)
+        assert deleted["result"] == {"deleted": True}
+
+        again = await call_tool(client, "metagate.admin_secret_refs", arguments)
+        assert again["error"]["message"] == "Secret ref not found"
+
+
+class TestAdminPagination:
+    """Tests for keyset pagination of admin list actions."""
+
+    @pytest.mark.asyncio
+    async def test_list_principals_pages_with_cursor(self, client, admin_api_key, test_principal):
+        """Should page through principals using next_cursor."""
+        first = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": admin_api_key, "action": "list", "limit": 1},
+        )
+        assert len(first["result"]["principals"]) == 1
+        assert first["result"]["next_cursor"] is not None
+
+        second = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {
+                "auth_token": admin_api_key,
+                "action": "list",
+                "limit": 1,
+                "cursor": first["result"]["next_cursor"],
+            },
+        )
+        assert len(second["result"]["principals"]) == 1
+        assert second["result"]["next_cursor"] is None
+        assert second["result"]["principals"][0]["id"] != first["result"]["principals"][0]["id"]
+
+    @pytest.mark.asyncio
+    async def test_list_rejects_invalid_limit(self, client, admin_api_key):
+        """Should reject page sizes outside the allowed range."""
+        data = await call_tool(
+            client,
+            "metagate.admin_principals",
+            {"auth_token": admin_api_key, "action": "list", "limit": 0},
+        )
+        assert "limit" in data["error"]["message"]
+
+
+class TestAdminManifests:
+    """Tests for manifest management via admin tools."""
+
+    @pytest.mark.asyncio
+    async def test_create_manifest_rejects_forbidden_keys(self, client, admin_api_key):
+        """Should refuse to store a manifest containing forbidden keys."""
+        data = await call_tool(
+            client,
+            "metagate.admin_manifests",
+            {
+                "auth_token": admin_api_key,
+                "action": "create",
+                "data": {
+                    "manifest_key": "bad-manifest",
+                    "environment": {},
+                    "services": {"worker": {"jobs": []}},
+                    "memory_map": {},
+                    "polling": {},
+                    "schemas": {},
+                },
+            },
+        )
+        assert data["error"]["code"] == "FORBIDDEN_KEYS"
+        assert "services.worker.jobs" in data["error"]["message"]
+
 
 class TestBootstrapEndpoint:
     """Tests for bootstrap API endpoint."""
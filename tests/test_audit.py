@@ -0,0 +1,43 @@
+"""Tests for the audit logging service."""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from metagate.models.db_models import AuditAction, AuditLog
+from metagate.services.audit import AuditBuffer
+
+
+class TestAuditBuffer:
+    """Tests for batched audit writes."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_all_entries(self, test_session):
+        """Should insert every queued entry and empty the buffer."""
+        buffer = AuditBuffer()
+        for index in range(3):
+            buffer.add(
+                action=AuditAction.CREATE,
+                resource_type="principal",
+                resource_id=uuid4(),
+                resource_key=f"principal-{index}",
+                actor_principal_key="admin-001",
+                metadata={"index": index},
+            )
+
+        assert await buffer.flush(test_session) == 3
+        await test_session.commit()
+        assert len(buffer) == 0
+
+        result = await test_session.execute(select(AuditLog).order_by(AuditLog.id))
+        entries = result.scalars().all()
+        assert [entry.resource_key for entry in entries] == ["principal-0", "principal-1", "principal-2"]
+        assert entries[0].action == "CREATE"
+        assert entries[2].metadata_ == {"index": 2}
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_buffer_is_noop(self, test_session):
+        """Should not issue an insert when nothing is queued."""
+        assert await AuditBuffer().flush(test_session) == 0
+        count = await test_session.scalar(select(func.count()).select_from(AuditLog))
+        assert count == 0
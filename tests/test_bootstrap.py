@@ -1,5 +1,6 @@
 """Tests for bootstrap service and API."""
 import pytest
+from sqlalchemy import event
 from uuid import uuid4
 from datetime import datetime, timezone, timedelta
 
@@ -9,6 +10,7 @@ from metagate.services.bootstrap import (
     BootstrapError,
     ForbiddenKeyError,
     cleanup_old_sessions,
+    generate_etag,
 )
 from metagate.models.db_models import Principal, Profile, Manifest, Binding, StartupSession
 
@@ -53,6 +55,18 @@ class TestForbiddenKeys:
         found = check_forbidden_keys(data)
         assert len(found) == 0
 
+    def test_detects_forbidden_keys_inside_lists(self):
+        """Should detect forbidden keys in dicts nested within lists."""
+        data = {"services": [{"name": "worker"}, {"jobs": []}]}
+        found = check_forbidden_keys(data)
+        assert found == {"services[1].jobs"}
+
+    def test_ignores_forbidden_words_in_values(self):
+        """Should not flag forbidden words that only appear in values."""
+        data = {"notes": 'see "tasks": later', "mode": "deploy"}
+        found = check_forbidden_keys(data)
+        assert len(found) == 0
+
 
 class TestComponentKeyValidation:
     """Tests for component_key validation against allowed_components."""
@@ -162,6 +176,13 @@ class TestETagCaching:
         assert packet2 is None
         assert cached is True
 
+    def test_etag_ignores_key_order(self):
+        """Should produce the same ETag for equal data in any key order."""
+        first = generate_etag({"services": {"a": 1, "b": 2}, "manifest_version": 1})
+        second = generate_etag({"manifest_version": 1, "services": {"b": 2, "a": 1}})
+        assert first == second
+        assert first != generate_etag({"services": {"a": 1, "b": 3}, "manifest_version": 1})
+
 
 class TestBootstrapFlow:
     """Tests for complete bootstrap flow."""
@@ -221,6 +242,39 @@ class TestBootstrapFlow:
         assert packet.startup.status == "OPEN"
         assert packet.startup.startup_id is not None
 
+    @pytest.mark.asyncio
+    async def test_bootstrap_reads_in_two_queries(
+        self,
+        test_engine,
+        test_session,
+        test_principal,
+        test_profile,
+        test_manifest,
+        test_binding,
+    ):
+        """Should load the binding bundle and env refs in two SELECTs, with no lazy loads."""
+        test_session.expunge_all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            packet, _ = await perform_bootstrap(
+                test_session,
+                test_principal,
+                "allowed-component",
+                None,
+                None,
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert packet is not None
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) <= 2
+
 
 class TestRetentionCleanup:
     """Tests for session retention cleanup."""
@@ -236,8 +290,8 @@ class TestRetentionCleanup:
             component_key="test-component",
             profile_key="test-profile",
             manifest_key="test-manifest",
-            packet_etag="etag123",
-            packet_hash_redacted="hash123",
+            packet_etag="0123456789abcdef0123456789abcdef",
+            packet_hash_redacted="0123456789abcdef",
             status="READY",
             opened_at=datetime.now(timezone.utc) - timedelta(hours=100),
             created_at=datetime.now(timezone.utc) - timedelta(hours=100),
@@ -259,8 +313,8 @@ class TestRetentionCleanup:
             component_key="test-component",
             profile_key="test-profile",
             manifest_key="test-manifest",
-            packet_etag="etag123",
-            packet_hash_redacted="hash123",
+            packet_etag="0123456789abcdef0123456789abcdef",
+            packet_hash_redacted="0123456789abcdef",
             status="OPEN",
             opened_at=datetime.now(timezone.utc) - timedelta(hours=100),
             created_at=datetime.now(timezone.utc) - timedelta(hours=100),
@@ -270,3 +324,27 @@ class TestRetentionCleanup:
 
         deleted = await cleanup_old_sessions(test_session, retention_hours=72)
         assert deleted == 0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_respects_batch_size(self, test_session):
+        """Should delete at most batch_size sessions per call."""
+        for _ in range(3):
+            test_session.add(StartupSession(
+                id=uuid4(),
+                tenant_key="default",
+                deployment_key="default",
+                subject_principal_key="test-principal",
+                component_key="test-component",
+                profile_key="test-profile",
+                manifest_key="test-manifest",
+                packet_etag="0123456789abcdef0123456789abcdef",
+                packet_hash_redacted="0123456789abcdef",
+                status="FAILED",
+                opened_at=datetime.now(timezone.utc) - timedelta(hours=100),
+                created_at=datetime.now(timezone.utc) - timedelta(hours=100),
+            ))
+        await test_session.commit()
+
+        assert await cleanup_old_sessions(test_session, retention_hours=72, batch_size=2) == 2
+        assert await cleanup_old_sessions(test_session, retention_hours=72, batch_size=2) == 1
+        assert await cleanup_old_sessions(test_session, retention_hours=72, batch_size=2) == 0
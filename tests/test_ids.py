@@ -0,0 +1,21 @@
+"""Tests for identifier generation."""
+from metagate.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for UUIDv7 generation."""
+
+    def test_version_and_variant(self):
+        """Should produce RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_unique(self):
+        """Should not repeat identifiers."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
+
+    def test_monotonic(self):
+        """Should sort in generation order, even within one millisecond."""
+        values = [uuid7() for _ in range(5000)]
+        assert values == sorted(values)
@@ -0,0 +1,111 @@
+"""Tests for the in-memory rate limiter."""
+import orjson
+import pytest
+from starlette.requests import Request
+
+from metagate.middleware.rate_limit import InMemoryRateLimiter, RateLimiter
+
+
+class TestInMemoryRateLimiter:
+    """Tests for sliding-window rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit(self):
+        """Should allow max_calls requests and then reject."""
+        limiter = InMemoryRateLimiter()
+        results = [await limiter.check_rate_limit("ip:1", 3, 60) for _ in range(4)]
+        assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+        assert [remaining for _, remaining, _ in results] == [2, 1, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self):
+        """Should track each key separately."""
+        limiter = InMemoryRateLimiter()
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is True
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is False
+        assert (await limiter.check_rate_limit("ip:2", 1, 60))[0] is True
+
+    @pytest.mark.asyncio
+    async def test_expired_calls_leave_window(self, monkeypatch):
+        """Should allow calls again once earlier ones fall out of the window."""
+        now = [1000.0]
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.time", lambda: now[0])
+        limiter = InMemoryRateLimiter()
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is True
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is False
+        now[0] += 61
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is True
+
+    @pytest.mark.asyncio
+    async def test_wall_clock_jump_does_not_reopen_window(self, monkeypatch):
+        """Should keep counting across a wall-clock change."""
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.monotonic", lambda: 1000.0)
+        wall = [5000.0]
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.time", lambda: wall[0])
+        limiter = InMemoryRateLimiter()
+        assert (await limiter.check_rate_limit("ip:1", 1, 60))[0] is True
+        wall[0] += 3600
+        allowed, _, reset_time = await limiter.check_rate_limit("ip:1", 1, 60)
+        assert allowed is False
+        assert reset_time == 8660
+
+    @pytest.mark.asyncio
+    async def test_reset_time_tracks_oldest_call(self, monkeypatch):
+        """Should report when the oldest counted call leaves the window."""
+        now = [1000.0]
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.time", lambda: now[0])
+        limiter = InMemoryRateLimiter()
+        await limiter.check_rate_limit("ip:1", 2, 60)
+        now[0] += 10
+        await limiter.check_rate_limit("ip:1", 2, 60)
+        now[0] += 10
+        allowed, _, reset_time = await limiter.check_rate_limit("ip:1", 2, 60)
+        assert allowed is False
+        assert reset_time == 1060
+        now[0] = 1060.0
+        assert (await limiter.check_rate_limit("ip:1", 2, 60))[0] is True
+
+
+class TestRateLimiter:
+    """Tests for per-request rate limiting."""
+
+    @staticmethod
+    def _request(host: str = "10.0.0.1") -> Request:
+        return Request({"type": "http", "client": (host, 1234), "headers": []})
+
+    @pytest.mark.asyncio
+    async def test_returns_429_response_when_limited(self):
+        """Should return, not raise, a 429 once the client is over its limit."""
+        limiter = RateLimiter(calls_per_minute=1)
+        assert await limiter.check_request(self._request()) is None
+
+        response = await limiter.check_request(self._request())
+        assert response.status_code == 429
+        assert orjson.loads(response.body) == {"detail": "Rate limit exceeded"}
+        assert response.headers["X-RateLimit-Limit"] == "1"
+        assert int(response.headers["Retry-After"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_flooding_client_skips_backend(self, monkeypatch):
+        """Should reject a flooding client from the sketch without consulting the window."""
+        monkeypatch.setattr("metagate.middleware.rate_limit.time.monotonic", lambda: 1000.0)
+        limiter = RateLimiter(calls_per_minute=2)
+        for _ in range(4):
+            await limiter.check_request(self._request())
+
+        async def fail(*args):
+            raise AssertionError("backend consulted")
+
+        monkeypatch.setattr(limiter.backend, "check_rate_limit", fail)
+        response = await limiter.check_request(self._request())
+        assert response.status_code == 429
+        assert 0 < int(response.headers["Retry-After"]) <= 10
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_allows_everything(self):
+        """Should never limit when disabled."""
+        limiter = RateLimiter(calls_per_minute=1, enabled=False)
+        for _ in range(3):
+            assert await limiter.check_request(self._request()) is None
@@ -23,8 +23,8 @@ async def open_session(test_session) -> StartupSession:
         component_key="test-component",
         profile_key="test-profile",
         manifest_key="test-manifest",
-        packet_etag="etag123",
-        packet_hash_redacted="hash123",
+        packet_etag="0123456789abcdef0123456789abcdef",
+        packet_hash_redacted="0123456789abcdef",
         status="OPEN",
         opened_at=datetime.now(timezone.utc),
         deadline_at=datetime.now(timezone.utc) + timedelta(minutes=2),
@@ -51,6 +51,19 @@ class TestMarkStartupReady:
         assert result.status == "READY"
         assert result.startup_id == open_session.id
 
+    @pytest.mark.asyncio
+    async def test_releases_connection_before_receipt(self, test_session, open_session, monkeypatch):
+        """Should not hold a transaction open while emitting the receipt."""
+        in_transaction = []
+
+        async def fake_emit(**kwargs):
+            in_transaction.append(test_session.in_transaction())
+
+        monkeypatch.setattr("metagate.services.startup.emit_startup_receipt", fake_emit)
+        await mark_startup_ready(test_session, open_session.id, build_version="1.0.0")
+
+        assert in_transaction == [False]
+
     @pytest.mark.asyncio
     async def test_cannot_mark_ready_twice(self, test_session, open_session):
         """Should fail to mark already-READY session as READY."""